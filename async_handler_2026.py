@@ -34,6 +34,8 @@ class IBKRSyncWrapper:
         self.client_id = client_id
         self.ib = None
         self.logger = logging.getLogger(__name__)
+        self._positions_by_con_id = {}  # Maintained from positionEvent; legs sharing a symbol stay separate
+        self.on_disconnect: Optional[Callable[[], None]] = None  # Called when IBKR drops the connection
         
     def connect(self):
         """Synchronously connect to IBKR Gateway"""
@@ -42,6 +44,11 @@ class IBKRSyncWrapper:
         self.ib = IB()
         self.ib.connect(self.host, self.port, clientId=self.client_id)
         
+        # Keep a conId-keyed position view current from IBKR position events
+        self._positions_by_con_id = {pos.contract.conId: pos for pos in self.ib.positions()}
+        self.ib.positionEvent += self._on_position
+        self.ib.disconnectedEvent += self._on_disconnected
+        
         # Switch to delayed data mode for better reliability outside trading hours
         self.ib.reqMarketDataType(4)  # 4 = Delayed data
         self.ib.sleep(0.5)  # Give time for the setting to take effect
@@ -56,6 +63,9 @@ class IBKRSyncWrapper:
     def disconnect(self):
         """Synchronously disconnect from IBKR"""
         if self.ib:
+            # Detach first: a deliberate disconnect isn't a lost connection
+            self.ib.positionEvent -= self._on_position
+            self.ib.disconnectedEvent -= self._on_disconnected
             self.ib.disconnect()
             self.logger.info("Disconnected from IBKR")
             
@@ -342,6 +352,29 @@ class IBKRSyncWrapper:
             
         return self.ib.positions()
         
+    def _on_disconnected(self):
+        """Forward IBKR disconnects to the registered on_disconnect callback"""
+        self.logger.warning("Disconnected from IBKR Gateway")
+        if self.on_disconnect:
+            try:
+                self.on_disconnect()
+            except Exception as e:
+                self.logger.error(f"Error in on_disconnect callback: {e}")
+            
+    def _on_position(self, position):
+        """Update the conId-keyed position view from an IBKR position event"""
+        if position.position == 0:
+            self._positions_by_con_id.pop(position.contract.conId, None)
+        else:
+            self._positions_by_con_id[position.contract.conId] = position
+            
+    def get_positions_dict(self) -> Dict:
+        """Get real positions keyed by contract conId - Used by the execution engine"""
+        if not self.ib or not self.ib.isConnected():
+            return {}
+            
+        return dict(self._positions_by_con_id)
+        
     def get_account_summary(self) -> Dict:
         """Get real account summary - Required by risk management"""
         if not self.ib or not self.ib.isConnected():
@@ -374,6 +407,15 @@ class IBKRSyncWrapper:
     def connected(self) -> bool:
         """Check if connected to IBKR"""
         return self.ib and self.ib.isConnected()
+        
+    def wait_until_ready(self, timeout: float = 10.0) -> bool:
+        """Wait until connected with account values loaded; False on timeout"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.connected and self.get_account_value() > 0:
+                return True
+            self.ib.sleep(0.05)  # Lets ib_insync process incoming updates
+        return False
 
 
 def create_sync_ibkr_client(host='127.0.0.1', port=4001, client_id=1):
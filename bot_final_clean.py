@@ -6,7 +6,6 @@ All testing code removed, all interface issues fixed
 
 import sys
 import os
-import signal
 import logging
 import time
 
@@ -60,17 +59,10 @@ def main():
     logger.info("Starting clean bot initialization...")
     
     try:
-        # Import and start the main bot
+        # Import and start the main bot; it installs its own signal handlers,
+        # which stop the bot through its stop event rather than sys.exit()
         from main_sync_with_web import main
         
-        # Setup signal handling
-        def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, shutting down...")
-            sys.exit(0)
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        
         # Start the bot
         logger.info("Starting main bot process...")
         main()
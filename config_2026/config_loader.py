@@ -1,5 +1,6 @@
 # config_2026/config_loader.py
 import os
+import functools
 from dotenv import load_dotenv
 import logging
 
@@ -51,6 +52,12 @@ class ConfigLoader2026:
         }
 
 
+@functools.lru_cache(maxsize=1)
+def get_config_loader(env_file='.env'):
+    """Get the process-wide config loader, loading the env file only once"""
+    return ConfigLoader2026(env_file)
+
+
 def load_config():
     """Load configuration - convenience function"""
-    return ConfigLoader2026().get_all_config()
+    return get_config_loader().get_all_config()
@@ -6,8 +6,8 @@ Manages trading workflow without async complexity
 import logging
 import time
 import threading
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta, time as dtime
 from enum import Enum
 import pytz
 import asyncio
@@ -45,12 +45,25 @@ class SyncExecutionEngine2026:
         # Engine state
         self.running = False
         self.trading_enabled = True
-        self.last_analysis_time = None
+        self.last_analysis_time = None  # Wall-clock epoch, for status display
+        self._next_analysis_at = 0.0  # time.monotonic() deadline for the next cycle
         self.analysis_interval = config.get('ANALYSIS_INTERVAL', 300)  # 5 minutes
         
+        # Cached market session as (valid_until, open, close) epoch seconds
+        self._market_hours_today: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+        
         # Threading
         self._thread = None
         self._news_thread = None
+        self._stop_event = threading.Event()  # Set by stop(); wakes every sleeping loop
+        self._wake = threading.Event()  # Wakes the analysis loop early (stop/force/enable)
+        self.max_idle_wait = 60.0  # seconds; upper bound on one analysis-loop sleep
+        
+        # Long-lived event loops for async components, one per worker thread
+        # ('main' for screening/strategies/orders, 'news' for sentiment) so a
+        # slow analysis cycle never delays the news refresh and vice versa
+        self._loops: Dict[str, Tuple[asyncio.AbstractEventLoop, threading.Thread]] = {}
+        self.coroutine_timeout = config.get('COROUTINE_TIMEOUT', 300)  # seconds
         
         # Continuous news monitoring
         self.news_running = False
@@ -69,6 +82,10 @@ class SyncExecutionEngine2026:
             return
             
         self.running = True
+        self._stop_event.clear()
+        self._wake.clear()
+        self._start_event_loop('main')
+        self._start_event_loop('news')
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
         
@@ -80,19 +97,70 @@ class SyncExecutionEngine2026:
         self.logger.info("🚀 Execution engine started")
         self.logger.info("📰 News monitor started - running continuously")
         
+    @property
+    def alive(self) -> bool:
+        """True while the engine is running and its main loop thread is up"""
+        return self.running and self._thread is not None and self._thread.is_alive()
+        
     def stop(self):
         """Stop the execution engine"""
         self.running = False
         self.news_running = False
+        self._stop_event.set()
+        self._wake.set()
         
         if self._thread:
             self._thread.join(timeout=10)
         if self._news_thread:
             self._news_thread.join(timeout=10)
+        self._stop_event_loop()
             
         self.logger.info("🛑 Execution engine stopped")
         self.logger.info("📰 News monitor stopped")
         
+    def _start_event_loop(self, name: str):
+        """Start the persistent event loop used by the named worker thread"""
+        if name in self._loops:
+            return
+            
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=self._run_event_loop, args=(loop,),
+                                  name=f"engine-loop-{name}", daemon=True)
+        thread.start()
+        self._loops[name] = (loop, thread)
+        
+    def _run_event_loop(self, loop: asyncio.AbstractEventLoop):
+        """Event loop thread body"""
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+        
+    def _stop_event_loop(self):
+        """Stop the persistent event loops, closing those that have exited"""
+        for name, (loop, thread) in list(self._loops.items()):
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=10)
+            if thread.is_alive():
+                # A blocking IBKR call is still holding the loop; closing a
+                # running loop raises, so leave the daemon thread to finish
+                self.logger.warning(f"Event loop '{name}' still busy after 10s - "
+                                    "leaving it to exit with the process")
+            else:
+                loop.close()
+        self._loops.clear()
+        
+    def _run_coroutine(self, coro, loop_name: str = 'main'):
+        """Run a coroutine on a worker's persistent event loop and wait for its result"""
+        if loop_name not in self._loops:
+            self._start_event_loop(loop_name)
+            
+        loop = self._loops[loop_name][0]
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout=self.coroutine_timeout)
+        except Exception:
+            future.cancel()
+            raise
+            
     def _run(self):
         """Main execution loop"""
         while self.running:
@@ -101,13 +169,15 @@ class SyncExecutionEngine2026:
                 if self._should_analyze():
                     self._execute_trading_cycle()
                     
-                # Sleep briefly
-                time.sleep(1)
+                # Sleep until the next analysis is due; stop(), force_analysis()
+                # and enable_trading() wake us early
+                self._wake.wait(self._seconds_until_next_analysis())
+                self._wake.clear()
                 
             except Exception as e:
                 self.logger.error(f"Error in execution loop: {e}", exc_info=True)
                 # Don't stop the bot on errors
-                time.sleep(30)  # Wait before retrying
+                self._stop_event.wait(30)  # Wait before retrying
                 continue  # Keep the loop running
                 
     def _news_monitor_run(self):
@@ -120,12 +190,12 @@ class SyncExecutionEngine2026:
                 self._update_news_sentiment()
                 
                 # Sleep for update interval
-                time.sleep(self.news_update_interval)
+                self._stop_event.wait(self.news_update_interval)
                 
             except Exception as e:
                 self.logger.error(f"Error in news monitoring loop: {e}", exc_info=True)
                 # Don't stop news monitoring on errors, just wait and retry
-                time.sleep(60)  # Wait 1 minute before retrying
+                self._stop_event.wait(60)  # Wait 1 minute before retrying
                 continue
                 
         self.logger.info("📰 News monitoring loop ended")
@@ -134,64 +204,53 @@ class SyncExecutionEngine2026:
         """Update market sentiment from news sources - runs continuously"""
         try:
             # Get fresh market sentiment from news handler
-            import asyncio
+            sentiment_data = self._run_coroutine(
+                self.news_analyzer.get_market_sentiment(), loop_name='news'
+            )
             
-            # Create new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            # Store the updated sentiment
+            self.current_market_sentiment = sentiment_data
+            self.last_news_update = time.time()
             
-            try:
-                # Get market sentiment asynchronously
-                sentiment_data = loop.run_until_complete(
-                    self.news_analyzer.get_market_sentiment()
-                )
-                
-                # Store the updated sentiment
-                self.current_market_sentiment = sentiment_data
-                self.last_news_update = time.time()
-                
-                # Log sentiment updates (less verbose during off-hours)
-                current_time = datetime.now()
-                overall_sentiment = sentiment_data.get('overall_sentiment', 'unknown')
-                sentiment_score = sentiment_data.get('sentiment_score', 0)
-                vix_level = sentiment_data.get('technical_sentiment', {}).get('vix_level', 20.0)
-                
-                if self._is_trading_hours():
-                    self.logger.info(f"📊 Market sentiment updated: {overall_sentiment} "
-                                   f"(score: {sentiment_score:.3f})")
+            # Log sentiment updates (less verbose during off-hours)
+            current_time = datetime.now()
+            overall_sentiment = sentiment_data.get('overall_sentiment', 'unknown')
+            sentiment_score = sentiment_data.get('sentiment_score', 0)
+            vix_level = sentiment_data.get('technical_sentiment', {}).get('vix_level', 20.0)
+            
+            if self._is_trading_hours():
+                self.logger.info(f"📊 Market sentiment updated: {overall_sentiment} "
+                               f"(score: {sentiment_score:.3f})")
+                if self.web_monitor:
+                    self.web_monitor.log_activity("NEWS", "success", 
+                        f"📊 Market sentiment: {overall_sentiment.upper()} "
+                        f"(VIX: {vix_level:.1f}, Score: {sentiment_score:.2f})")
+            else:
+                # Log less frequently during off-hours (every 10 updates)
+                if not hasattr(self, '_news_update_count'):
+                    self._news_update_count = 0
+                self._news_update_count += 1
+                
+                if self._news_update_count % 10 == 0:
+                    self.logger.info(f"📊 After-hours sentiment: {overall_sentiment} "
+                                   f"(updates: {self._news_update_count})")
                     if self.web_monitor:
-                        self.web_monitor.log_activity("NEWS", "success", 
-                            f"📊 Market sentiment: {overall_sentiment.upper()} "
-                            f"(VIX: {vix_level:.1f}, Score: {sentiment_score:.2f})")
-                else:
-                    # Log less frequently during off-hours (every 10 updates)
-                    if not hasattr(self, '_news_update_count'):
-                        self._news_update_count = 0
-                    self._news_update_count += 1
-                    
-                    if self._news_update_count % 10 == 0:
-                        self.logger.info(f"📊 After-hours sentiment: {overall_sentiment} "
-                                       f"(updates: {self._news_update_count})")
-                        if self.web_monitor:
-                            self.web_monitor.log_activity("NEWS", "info", 
-                                f"🌙 After-hours update #{self._news_update_count}: {overall_sentiment.upper()}")
-                
-                # Update web monitor if available
-                if self.web_monitor and sentiment_data:
-                    market_sentiment = {
-                        'current_sentiment': sentiment_data.get('overall_sentiment', 'neutral'),
-                        'sentiment_score': sentiment_data.get('sentiment_score', 0),
-                        'last_update': datetime.now().isoformat(),
-                        'confidence': sentiment_data.get('confidence', 0.5),
-                        'volatility_expected': sentiment_data.get('volatility_expected', 0.5),
-                        'news_sources': sentiment_data.get('data_sources', []),
-                        'sector_sentiment': sentiment_data.get('sector_sentiment', {}),
-                        'technical_sentiment': sentiment_data.get('technical_sentiment', {})
-                    }
-                    self.web_monitor.update_market_sentiment(market_sentiment)
-                    
-            finally:
-                loop.close()
+                        self.web_monitor.log_activity("NEWS", "info", 
+                            f"🌙 After-hours update #{self._news_update_count}: {overall_sentiment.upper()}")
+            
+            # Update web monitor if available
+            if self.web_monitor and sentiment_data:
+                market_sentiment = {
+                    'current_sentiment': sentiment_data.get('overall_sentiment', 'neutral'),
+                    'sentiment_score': sentiment_data.get('sentiment_score', 0),
+                    'last_update': datetime.now().isoformat(),
+                    'confidence': sentiment_data.get('confidence', 0.5),
+                    'volatility_expected': sentiment_data.get('volatility_expected', 0.5),
+                    'news_sources': sentiment_data.get('data_sources', []),
+                    'sector_sentiment': sentiment_data.get('sector_sentiment', {}),
+                    'technical_sentiment': sentiment_data.get('technical_sentiment', {})
+                }
+                self.web_monitor.update_market_sentiment(market_sentiment)
                 
         except Exception as e:
             self.logger.error(f"Error updating news sentiment: {e}")
@@ -213,35 +272,57 @@ class SyncExecutionEngine2026:
         if not self._is_trading_hours():
             return False
             
-        # Check analysis interval
-        if self.last_analysis_time:
-            elapsed = time.time() - self.last_analysis_time
-            if elapsed < self.analysis_interval:
-                return False
-                
-        return True
+        # Check analysis interval against a monotonic deadline, so wall-clock
+        # jumps (NTP, DST) can neither skip nor double-fire a cycle
+        return time.monotonic() >= self._next_analysis_at
+        
+    def _seconds_until_next_analysis(self) -> float:
+        """How long the analysis loop can sleep before _should_analyze may change"""
+        if not self.trading_enabled:
+            return self.max_idle_wait
+            
+        now = time.time()
+        self._is_trading_hours()  # Refreshes the cached session if it expired
+        valid_until, market_open, market_close = self._market_hours_today
+        
+        if now < market_open:
+            delay = market_open - now
+        elif now > market_close:
+            delay = valid_until - now  # Closed (or weekend): next session is tomorrow
+        else:
+            delay = self._next_analysis_at - time.monotonic()
+            
+        # Never below the old 1s poll, so a cycle that fails early can't spin
+        return min(max(delay, 1.0), self.max_idle_wait)
         
     def _is_trading_hours(self) -> bool:
         """Check if market is open"""
-        # Get current time in ET directly
+        now = time.time()
+        valid_until, market_open, market_close = self._market_hours_today
+        
+        if now >= valid_until:
+            valid_until, market_open, market_close = self._refresh_market_hours()
+            
+        return market_open <= now <= market_close
+        
+    def _refresh_market_hours(self) -> Tuple[float, float, float]:
+        """Compute today's market session in epoch seconds, valid until ET midnight"""
         et_tz = pytz.timezone('US/Eastern')
-        et_time = datetime.now(et_tz)
-        weekday = et_time.weekday()
+        today = datetime.now(et_tz).date()
+        tomorrow = today + timedelta(days=1)
+        valid_until = et_tz.localize(datetime.combine(tomorrow, dtime.min)).timestamp()
         
         # Skip weekends
-        if weekday >= 5:
-            return False
+        if today.weekday() >= 5:
+            self._market_hours_today = (valid_until, 0.0, 0.0)
+            return self._market_hours_today
             
-        # Market hours: 9:30 AM - 4:00 PM ET
-        hour = et_time.hour
-        minute = et_time.minute
-        
-        # Convert to minutes for easier comparison
-        current_minutes = hour * 60 + minute
-        market_open = 9 * 60 + 30  # 9:30 AM
-        market_close = 16 * 60     # 4:00 PM
+        # Market hours: 9:30 AM - 4:00 PM ET (inclusive of the 4:00 minute)
+        market_open = et_tz.localize(datetime.combine(today, dtime(9, 30))).timestamp()
+        market_close = et_tz.localize(datetime.combine(today, dtime(16, 0))).timestamp() + 59
         
-        return market_open <= current_minutes <= market_close
+        self._market_hours_today = (valid_until, market_open, market_close)
+        return self._market_hours_today
         
     def _execute_trading_cycle(self):
         """Execute one complete trading cycle"""
@@ -251,6 +332,7 @@ class SyncExecutionEngine2026:
                 self.web_monitor.log_activity("EXECUTION", "info", "🚀 Starting new trading cycle")
                 
             self.last_analysis_time = time.time()
+            self._next_analysis_at = time.monotonic() + self.analysis_interval
             
             # Step 1: Get market sentiment
             self.logger.debug("Analyzing sentiment...")
@@ -313,12 +395,8 @@ class SyncExecutionEngine2026:
                 
             self._update_positions()
             
-            # Step 5: Manage existing positions
-            self.logger.debug("Managing positions...")
-            if self.web_monitor:
-                self.web_monitor.log_activity("EXECUTION", "info", "🔧 Managing existing positions...")
-                
-            self._manage_positions()
+            # Strategy manage_positions() is async and not run here; exits are
+            # handled by the portfolio monitor
             
             self.logger.info("Trading cycle completed")
             if self.web_monitor:
@@ -447,41 +525,30 @@ class SyncExecutionEngine2026:
                 self.web_monitor.log_activity("SCREENER", "info", 
                     f"🔍 Screening S&P 500 universe for {sentiment.value} opportunities...")
             
-            # Run async screening in sync context
-            import asyncio
-            import nest_asyncio
+            # Run the sophisticated screener on the persistent event loop
+            candidates = self._run_coroutine(
+                self.stock_screener.screen_stocks(market_sentiment)
+            )
             
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            self.logger.info(f"Sophisticated screener found {len(candidates)} candidates: {candidates[:5]}...")
+            if self.web_monitor:
+                self.web_monitor.log_activity("SCREENER", "success", 
+                    f"📈 Found {len(candidates)} qualified candidates: {', '.join(candidates[:5])}" + 
+                    (f" +{len(candidates)-5} more" if len(candidates) > 5 else ""))
             
-            try:
-                # Use the sophisticated screener's screen_stocks method
-                candidates = loop.run_until_complete(
-                    self.stock_screener.screen_stocks(market_sentiment)
-                )
-                
-                self.logger.info(f"Sophisticated screener found {len(candidates)} candidates: {candidates[:5]}...")
-                if self.web_monitor:
-                    self.web_monitor.log_activity("SCREENER", "success", 
-                        f"📈 Found {len(candidates)} qualified candidates: {', '.join(candidates[:5])}" + 
-                        (f" +{len(candidates)-5} more" if len(candidates) > 5 else ""))
-                
-                # Update web monitor with sophisticated screening results if available
-                if self.web_monitor and candidates:
-                    # Get full screening results for web display
-                    try:
-                        full_results = loop.run_until_complete(
-                            self._get_full_screening_results_sync(market_sentiment)
-                        )
-                        if full_results:
-                            self.web_monitor.update_screening_results(full_results)
-                    except Exception as e:
-                        self.logger.warning(f"Could not update web screening results: {e}")
-                
-                return candidates
-                
-            finally:
-                loop.close()
+            # Update web monitor with sophisticated screening results if available
+            if self.web_monitor and candidates:
+                # Get full screening results for web display
+                try:
+                    full_results = self._run_coroutine(
+                        self._get_full_screening_results_sync(market_sentiment)
+                    )
+                    if full_results:
+                        self.web_monitor.update_screening_results(full_results)
+                except Exception as e:
+                    self.logger.warning(f"Could not update web screening results: {e}")
+            
+            return candidates
                 
         except Exception as e:
             self.logger.error(f"Error with sophisticated screener: {e}")
@@ -569,8 +636,7 @@ class SyncExecutionEngine2026:
                     self.web_monitor.log_activity("STRATEGY", "info", 
                         f"🔎 Analyzing {symbol} for {strategy_name} options opportunities...")
                 
-                # Run async strategy methods synchronously
-                import asyncio
+                # Run async strategy methods on the persistent event loop
                 from async_sync_adapter import AsyncSyncAdapter
                 
                 # Create async adapter for the sync client
@@ -580,10 +646,6 @@ class SyncExecutionEngine2026:
                 original_client = strategy.ibkr_client
                 strategy.ibkr_client = async_client
                 
-                # Scan for opportunities
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
                 # Create market sentiment dict for strategies that need it
                 market_sentiment_dict = {
                     'sentiment_score': 0.0,
@@ -596,11 +658,11 @@ class SyncExecutionEngine2026:
                 
                 # Call appropriate scan method based on strategy type
                 if strategy_name == 'volatility':
-                    opportunities = loop.run_until_complete(
+                    opportunities = self._run_coroutine(
                         strategy.scan_opportunities([symbol], market_sentiment_dict)
                     )
                 else:
-                    opportunities = loop.run_until_complete(
+                    opportunities = self._run_coroutine(
                         strategy.scan_opportunities([symbol])
                     )
                 
@@ -630,7 +692,7 @@ class SyncExecutionEngine2026:
                         )
                     
                     # Execute the trade
-                    order_id = loop.run_until_complete(
+                    order_id = self._run_coroutine(
                         strategy.execute_trade(opportunity)
                     )
                     
@@ -688,54 +750,23 @@ class SyncExecutionEngine2026:
                 # Restore original client
                 strategy.ibkr_client = original_client
                     
-                loop.close()
-                    
             except Exception as e:
                 self.logger.error(f"Error executing strategy for {symbol}: {e}")
                 
     def _update_positions(self):
         """Update active positions tracking"""
         try:
-            positions = self.ibkr_client.get_positions()
-            self.active_positions = {
-                pos.contract.symbol: pos for pos in positions
-            }
+            # Keyed by conId so spread legs on the same symbol are all tracked
+            self.active_positions = self.ibkr_client.get_positions_dict()
             
             # Calculate daily P&L
             self.daily_pnl = sum(
-                getattr(pos, 'unrealizedPNL', 0) for pos in positions
+                getattr(pos, 'unrealizedPNL', 0) for pos in self.active_positions.values()
             )
             
         except Exception as e:
             self.logger.error(f"Error updating positions: {e}")
             
-    def _manage_positions(self):
-        """Check each strategy's position management rules"""
-        try:
-            # Get current positions
-            positions = list(self.active_positions.values())
-            
-            if not positions:
-                return
-                
-            # Let each strategy check its positions
-            for strategy in self.strategies:
-                try:
-                    # Check if strategy has manage_positions method
-                    if hasattr(strategy, 'manage_positions'):
-                        # Note: manage_positions is async in the strategy modules
-                        # For sync engine, we'll need to handle this differently
-                        # For now, we'll rely on the portfolio monitor
-                        pass
-                        
-                except Exception as e:
-                    self.logger.error(f"Error in strategy position management: {e}")
-                    
-            self.logger.debug(f"Managed {len(positions)} positions")
-            
-        except Exception as e:
-            self.logger.error(f"Error managing positions: {e}")
-    
     def get_status(self) -> Dict[str, Any]:
         """Get current engine status"""
         return {
@@ -751,6 +782,7 @@ class SyncExecutionEngine2026:
     def enable_trading(self):
         """Enable trading"""
         self.trading_enabled = True
+        self._wake.set()
         self.logger.info("Trading enabled")
         
     def disable_trading(self):
@@ -761,4 +793,6 @@ class SyncExecutionEngine2026:
     def force_analysis(self):
         """Force an immediate analysis cycle"""
         self.last_analysis_time = 0
+        self._next_analysis_at = 0.0
+        self._wake.set()
         self.logger.info("Forced analysis requested") 
\ No newline at end of file
@@ -7,13 +7,19 @@ import requests
 import json
 import time
 
+# Shared session so repeated API calls reuse one keep-alive connection
+SESSION = requests.Session()
+
 # Find the execution engine and force analysis
 print("🔧 Attempting to trigger a trading cycle...")
 
 # Check if bot is running
 try:
-    response = requests.get('http://localhost:5001/api/status')
-    data = response.json()
+    response = SESSION.get('http://localhost:5001/api/status', timeout=5)
+    try:
+        data = response.json()
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON from /api/status (HTTP {response.status_code}): {e}")
     print(f"✅ Bot status: {data['bot_status']}")
     print(f"💰 Portfolio value: ${data['portfolio_value']:,.2f}")
     
@@ -1,25 +1,39 @@
 # ibkr_client_2026/client.py
 import asyncio
+from contextlib import asynccontextmanager
 from ib_insync import IB, Contract, Order, Stock, Option, util, MarketOrder, LimitOrder
 from typing import Dict, List, Optional, Union
 import logging
 from datetime import datetime, timedelta
 import pandas as pd
 
+# Account summary tags whose values are numeric and should be returned as floats
+_FLOAT_ACCOUNT_TAGS = frozenset({
+    'NetLiquidation', 'TotalCashValue', 'BuyingPower',
+    'GrossPositionValue', 'MaintMarginReq', 'AvailableFunds',
+    'UnrealizedPnL', 'RealizedPnL', 'ExcessLiquidity'
+})
+
 class IBKRClient2026:
     """
     Client for interacting with Interactive Brokers API.
     Properly uses ib_insync async methods.
     """
-    def __init__(self, host='127.0.0.1', port=4001, client_id=1):
+    def __init__(self, host='127.0.0.1', port=4001, client_id=1, pool_size=1):
         self.ib = IB()
         self.host = host
         self.port = port
         self.client_id = client_id
+        self.pool_size = max(1, pool_size)
+        self._pool_sessions: List[IB] = []  # Extra sessions using client_id + 1, + 2, ...
+        self._session_queue: Optional[asyncio.Queue] = None
         self.logger = logging.getLogger(__name__)
         self.market_data_cache = {}
         self.connected = False
         self._tickers = {}  # Store active ticker subscriptions
+        self._chosen_news_provider: Optional[str] = None  # Resolved once per session
+        self._positions_by_con_id: Dict[int, object] = {}  # Maintained from positionEvent; legs sharing a symbol stay separate
+        self.ib.positionEvent += self._on_position  # Subscribed once; self.ib lives as long as the client
 
     async def connect(self):
         """Connect to the IBKR Gateway."""
@@ -29,11 +43,46 @@ class IBKRClient2026:
             # For ib_insync, we need to ensure it's connected properly
             await self.ib.connectAsync(self.host, self.port, self.client_id)
             self.connected = True
+            
+            # Seed the conId-keyed position view; positionEvent keeps it current
+            self._positions_by_con_id = {pos.contract.conId: pos for pos in self.ib.positions()}
             self.logger.info(f"Connected to IBKR Gateway at {self.host}:{self.port}")
+            
+            await self._connect_pool()
         except Exception as e:
             self.logger.error(f"Failed to connect to IBKR Gateway: {e}")
             raise
 
+    async def _connect_pool(self):
+        """Open extra sessions for concurrent request/response calls."""
+        for offset in range(1, self.pool_size):
+            session = IB()
+            try:
+                await session.connectAsync(self.host, self.port, self.client_id + offset)
+                self._pool_sessions.append(session)
+            except Exception as e:
+                self.logger.warning(f"Could not open pooled IBKR session {self.client_id + offset}: {e}")
+        
+        self._session_queue = asyncio.Queue()
+        for session in [self.ib] + self._pool_sessions:
+            self._session_queue.put_nowait(session)
+        
+        if self._pool_sessions:
+            self.logger.info(f"IBKR session pool ready with {len(self._pool_sessions) + 1} sessions")
+
+    @asynccontextmanager
+    async def _acquire_session(self):
+        """Borrow an IB session from the pool, falling back to the primary one."""
+        if self._session_queue is None:
+            yield self.ib
+            return
+        
+        session = await self._session_queue.get()
+        try:
+            yield session
+        finally:
+            self._session_queue.put_nowait(session)
+
     async def disconnect(self):
         """Disconnect from the IBKR Gateway."""
         if self.connected:
@@ -42,6 +91,11 @@ class IBKRClient2026:
                 self.ib.cancelMktData(ticker)
             self._tickers.clear()
             
+            for session in self._pool_sessions:
+                session.disconnect()
+            self._pool_sessions.clear()
+            self._session_queue = None
+            
             self.ib.disconnect()
             self.connected = False
             self.logger.info("Disconnected from IBKR")
@@ -67,6 +121,17 @@ class IBKRClient2026:
             self.logger.error(f"Error getting account value: {e}")
             return 0.0
 
+    def _on_position(self, position):
+        """Update the conId-keyed position view from an IBKR position event."""
+        if position.position == 0:
+            self._positions_by_con_id.pop(position.contract.conId, None)
+        else:
+            self._positions_by_con_id[position.contract.conId] = position
+
+    def get_positions_dict(self) -> Dict[int, object]:
+        """Get current positions keyed by contract conId."""
+        return dict(self._positions_by_con_id)
+
     async def get_positions(self):
         """Get current positions."""
         try:
@@ -119,16 +184,17 @@ class IBKRClient2026:
         try:
             contract = Stock(symbol, 'SMART', 'USD')
             
-            # Request historical data
-            bars = await self.ib.reqHistoricalDataAsync(
-                contract,
-                endDateTime='',
-                durationStr=duration,
-                barSizeSetting=bar_size,
-                whatToShow=what_to_show,
-                useRTH=True,
-                formatDate=1
-            )
+            # Request historical data on a pooled session
+            async with self._acquire_session() as ib:
+                bars = await ib.reqHistoricalDataAsync(
+                    contract,
+                    endDateTime='',
+                    durationStr=duration,
+                    barSizeSetting=bar_size,
+                    whatToShow=what_to_show,
+                    useRTH=True,
+                    formatDate=1
+                )
             
             if bars:
                 # Convert to pandas DataFrame
@@ -288,15 +354,10 @@ class IBKRClient2026:
             
             summary = self.ib.accountSummary()
             
-            result = {}
-            for item in summary:
-                result[item.tag] = float(item.value) if item.tag in [
-                    'NetLiquidation', 'TotalCashValue', 'BuyingPower',
-                    'GrossPositionValue', 'MaintMarginReq', 'AvailableFunds',
-                    'UnrealizedPnL', 'RealizedPnL', 'ExcessLiquidity'
-                ] else item.value
-            
-            return result
+            return {
+                item.tag: float(item.value) if item.tag in _FLOAT_ACCOUNT_TAGS else item.value
+                for item in summary
+            }
         except Exception as e:
             self.logger.error(f"Error getting account summary: {e}")
             return {}
@@ -368,12 +429,24 @@ class IBKRClient2026:
     async def reqContractDetails(self, contract: Contract):
         """Get contract details."""
         try:
-            details = await self.ib.reqContractDetailsAsync(contract)
+            async with self._acquire_session() as ib:
+                details = await ib.reqContractDetailsAsync(contract)
             return details
         except Exception as e:
             self.logger.error(f"Error getting contract details: {e}")
             return []
 
+    async def _ensure_news_provider(self):
+        """Resolve the preferred news provider code once and cache it."""
+        if self._chosen_news_provider is None:
+            providers = await self.ib.reqNewsProvidersAsync() or []
+            # Prefer real-time breaking news provider (e.g., 'BRFG') or the first provider
+            self._chosen_news_provider = next(
+                (p.code for p in providers if p.code.upper().startswith('BRF')),
+                providers[0].code if providers else None
+            )
+        return self._chosen_news_provider
+
     async def reqNewsArticle(self, symbol: str):
         """Retrieve recent news articles for *symbol* via IBKR Historical News API.
 
@@ -381,24 +454,12 @@ class IBKRClient2026:
         account has the *News* subscription enabled in TWS / Gateway.
         """
         try:
-            # 1) Retrieve available news providers once and cache them
-            if not hasattr(self, '_news_providers_cache'):
-                providers = await self.ib.reqNewsProvidersAsync()
-                self._news_providers_cache = providers or []
-
-            if not self._news_providers_cache:
+            # 1) Resolve the news provider once per session
+            provider_code = await self._ensure_news_provider()
+            if provider_code is None:
                 self.logger.warning("No news providers returned; is the News subscription enabled?")
                 return []
 
-            # Prefer real-time breaking news provider (e.g., 'BRFG') or the first provider
-            provider_code = None
-            for p in self._news_providers_cache:
-                if p.code.upper().startswith('BRF'):
-                    provider_code = p.code
-                    break
-            if provider_code is None:
-                provider_code = self._news_providers_cache[0].code
-
             # 2) Qualify contract to obtain conId
             contract_details = await self.reqContractDetails(Stock(symbol, 'SMART', 'USD'))
             if not contract_details:
@@ -419,15 +480,18 @@ class IBKRClient2026:
             if not headlines:
                 return []
 
-            # 4) For each headline, request full article text (optional)
+            # 4) Request full article text for all headlines concurrently (optional)
+            results = await asyncio.gather(
+                *(self.ib.reqNewsArticleAsync(h.providerCode, h.articleId) for h in headlines),
+                return_exceptions=True
+            )
+
             articles = []
-            for h in headlines:
-                try:
-                    article = await self.ib.reqNewsArticleAsync(h.providerCode, h.articleId)
-                    articles.append(article)
-                except Exception as inner_exc:
-                    self.logger.debug(f"Unable to fetch article {h.articleId}: {inner_exc}")
+            for h, result in zip(headlines, results):
+                if isinstance(result, Exception):
+                    self.logger.debug(f"Unable to fetch article {h.articleId}: {result}")
                     continue
+                articles.append(result)
 
             return articles
 
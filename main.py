@@ -1,26 +1,20 @@
 # main.py
 import logging
+import logging.handlers
+import os
+import queue
 import asyncio
-from ibkr_client_2026.client import IBKRClient2026
-from config_2026.config_loader import ConfigLoader2026
-from risk_mgmt_2026.risk_manager import RiskManager2026
-from risk_mgmt_2026.portfolio_monitor import PortfolioMonitor2026
-from execution_engine_2026.engine import ExecutionEngine2026
-from web_monitor_2026.monitor_server import BotMonitorServer
-from risk_mgmt_2026.portfolio_provider import PortfolioProvider2026
-from bull_module_2026.bull import BullModule2026
-from bear_module_2026.bear import BearModule2026
-from volatile_module_2026.volatile import VolatileModule2026
-from news_handler_2026.news import NewsHandler2026
-from stock_screener_2026.screener import StockScreener2026
-import signal
+import contextlib
+import random
 import sys
+import time
 from datetime import datetime
 
 class OptionsTradingBot2026:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.running = False
+        self._stop_event = asyncio.Event()  # Set by shutdown() to wake the trading loop
         
         # Initialize components
         self.config = None
@@ -37,6 +31,7 @@ class OptionsTradingBot2026:
         
         # Initialize web monitor
         self.web_monitor = None
+        self._update_monitor = self._noop_update_monitor  # Swapped in once the monitor exists
         
         # Initialize market sentiment tracking
         self.current_sentiment = {
@@ -54,6 +49,7 @@ class OptionsTradingBot2026:
             'timestamp': datetime.now().isoformat(),
             'data_sources': []
         }
+        self._pushed_sentiment = None  # Last sentiment sent to the web monitor
         
         # Initialize error tracking
         self.error_counts = {
@@ -63,34 +59,48 @@ class OptionsTradingBot2026:
         }
         self.max_retries = 3
         self.retry_delay = 60  # seconds
+        self._trading_interval = 300  # seconds, read from config in initialize()
         
-        # Set up signal handlers
-        self._setup_signal_handlers()
+        # Short-lived caches for values polled several times per cycle
+        self._pv_cache = (0.0, 0.0)  # (value, monotonic timestamp)
+        self._pv_ttl = 5.0  # seconds
+        self._health_cache = (None, 0.0)  # (status, monotonic timestamp)
+        self._health_ttl = 0.5  # seconds
 
-    def _setup_signal_handlers(self):
-        """Set up signal handlers for graceful shutdown"""
-        loop = asyncio.get_event_loop()
+    async def _setup_signal_handlers(self):
+        """Set up signal handlers for graceful shutdown on the running loop"""
+        import signal
+        
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, lambda: asyncio.create_task(self.shutdown()))
+            try:
+                loop.add_signal_handler(sig, lambda s=sig: asyncio.create_task(self.shutdown()))
+            except NotImplementedError:
+                # Windows event loops don't support add_signal_handler
+                signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(
+                    lambda: asyncio.ensure_future(self.shutdown())))
 
     async def start_trading(self):
         """Start the trading bot"""
         try:
             self.logger.info("Starting trading bot...")
             self.running = True
+            interval = self._trading_interval
+            backoff = 1.0  # seconds; doubles per consecutive failure up to retry_delay
             
             while self.running:
                 try:
                     if not await self.check_component_health():
                         self.logger.error("Component health check failed")
-                        await asyncio.sleep(self.retry_delay)
+                        await self._wait_for_stop(self.retry_delay)
                         continue
                     
-                    await self.execution_engine.run_trading_cycle()
-                    await self.update_monitor()
+                    await self._run_cycle()
+                    backoff = 1.0
+                    self.error_counts['trading_cycle'] = 0
                     
-                    # Sleep for the configured interval
-                    await asyncio.sleep(self.config.get('trading_cycle_interval', 300))
+                    # Wait for the configured interval, or until shutdown
+                    await self._wait_for_stop(interval)
                     
                 except Exception as e:
                     self.error_counts['trading_cycle'] += 1
@@ -99,52 +109,70 @@ class OptionsTradingBot2026:
                         self.logger.error("Max retries exceeded, stopping bot")
                         await self.shutdown()
                         break
-                    await asyncio.sleep(self.retry_delay)
+                    await self._wait_for_stop(backoff + random.uniform(0, 0.5))
+                    backoff = min(backoff * 2, self.retry_delay)
                     
         except Exception as e:
             self.logger.error(f"Fatal error in trading bot: {e}")
             await self.shutdown()
 
-    async def get_portfolio_value(self) -> float:
-        """Get current portfolio value"""
+    async def _run_cycle(self):
+        """Run the trading cycle, then publish its results to the monitor"""
+        await self.execution_engine.run_trading_cycle()
+        # After the cycle, so the dashboard reflects this cycle's trades
+        await self._update_monitor()
+
+    async def _wait_for_stop(self, timeout: float):
+        """Sleep for up to timeout seconds, returning early if shutdown is requested"""
         try:
-            return await self.ibkr_client.get_account_value()
-        except Exception as e:
-            self.logger.error(f"Error getting portfolio value: {e}")
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def get_portfolio_value(self) -> float:
+        """Get current portfolio value, cached for a few seconds"""
+        value, fetched_at = self._pv_cache
+        if fetched_at and time.monotonic() - fetched_at < self._pv_ttl:
+            return value
+        
+        value = await self.ibkr_client.get_account_value()
+        
+        # The client reports a failed lookup as 0.0; don't cache that
+        if value <= 0:
             return 0.0
+        self._pv_cache = (value, time.monotonic())
+        return value
 
     async def get_active_trades(self) -> list:
         """Get list of active trades"""
-        try:
-            # TODO: Implement get_active_trades in portfolio monitor
-            return []
-        except Exception as e:
-            self.logger.error(f"Error getting active trades: {e}")
-            return []
+        # TODO: Implement get_active_trades in portfolio monitor
+        return []
 
-    async def get_risk_metrics(self) -> dict:
-        """Get current risk metrics"""
-        try:
+    async def get_risk_metrics(self, portfolio_value: float = None, active_trades: list = None) -> dict:
+        """Get current risk metrics, reusing already-fetched values when given"""
+        if portfolio_value is None:
             portfolio_value = await self.get_portfolio_value()
+        if active_trades is None:
             active_trades = await self.get_active_trades()
-            
-            return {
-                'portfolio_value': portfolio_value,
-                'daily_pnl': 0.0,  # TODO: Implement
-                'total_pnl': 0.0,  # TODO: Implement
-                'position_count': len(active_trades),
-                'risk_exposure': 0.0,  # TODO: Implement
-                'volatility_metrics': {},  # TODO: Implement
-                'sector_exposure': {}  # TODO: Implement
-            }
-        except Exception as e:
-            self.logger.error(f"Error getting risk metrics: {e}")
-            return {}
+        
+        return {
+            'portfolio_value': portfolio_value,
+            'daily_pnl': 0.0,  # TODO: Implement
+            'total_pnl': 0.0,  # TODO: Implement
+            'position_count': len(active_trades),
+            'risk_exposure': 0.0,  # TODO: Implement
+            'volatility_metrics': {},  # TODO: Implement
+            'sector_exposure': {}  # TODO: Implement
+        }
 
     async def get_health_status(self) -> dict:
-        """Get health status of all components"""
+        """Get health status of all components, cached for health_status_ttl (0.5s by default)"""
+        status, fetched_at = self._health_cache
+        if status is not None and time.monotonic() - fetched_at < self._health_ttl:
+            return status
+        
         try:
-            return {
+            status = {
                 'ibkr_connection': self.ibkr_client.connected if self.ibkr_client else False,
                 'portfolio_monitor': self.portfolio_monitor.is_monitoring() if self.portfolio_monitor else False,
                 'execution_engine': self.execution_engine.is_running() if self.execution_engine else False,
@@ -152,6 +180,8 @@ class OptionsTradingBot2026:
                 'news_handler': True if self.news_handler else False,
                 'stock_screener': True if self.stock_screener else False
             }
+            self._health_cache = (status, time.monotonic())
+            return status
         except Exception as e:
             self.logger.error(f"Error getting health status: {e}")
             return {
@@ -169,33 +199,57 @@ class OptionsTradingBot2026:
             if not self.web_monitor:
                 return
             
-            # Get current portfolio value
-            portfolio_value = await self.get_portfolio_value()
-            
-            # Get active trades
-            active_trades = await self.get_active_trades()
+            # Fetch portfolio value, active trades and health status concurrently
+            portfolio_value, active_trades, health_status = await asyncio.gather(
+                self.get_portfolio_value(),
+                self.get_active_trades(),
+                self.get_health_status(),
+                return_exceptions=True
+            )
+            if isinstance(portfolio_value, Exception):
+                self.logger.error(f"Error getting portfolio value: {portfolio_value}")
+                portfolio_value = 0.0
+            if isinstance(active_trades, Exception):
+                self.logger.error(f"Error getting active trades: {active_trades}")
+                active_trades = []
+            if isinstance(health_status, Exception):
+                self.logger.error(f"Error getting health status: {health_status}")
+                health_status = {}
             
-            # Get risk metrics
-            risk_metrics = await self.get_risk_metrics()
+            # Derive risk metrics from the values already fetched
+            risk_metrics = await self.get_risk_metrics(portfolio_value, active_trades)
             
-            # Get health status
-            health_status = await self.get_health_status()
+            # Update monitor with a single snapshot; serialising and broadcasting
+            # it to socket clients is blocking, so keep it off the event loop
+            snapshot = {
+                'portfolio_value': portfolio_value,
+                'active_trades': active_trades,
+                'risk_metrics': risk_metrics,
+                'health_status': health_status
+            }
             
-            # Update monitor
-            self.web_monitor.update_portfolio_value(portfolio_value)
-            self.web_monitor.update_active_trades(active_trades)
-            self.web_monitor.update_risk_metrics(risk_metrics)
-            self.web_monitor.update_health_status(health_status)
-            self.web_monitor.update_market_sentiment(self.current_sentiment)
+            # Sentiment rarely changes between cycles; only push it when it does
+            if self.current_sentiment != self._pushed_sentiment:
+                snapshot['market_sentiment'] = self.current_sentiment
+                self._pushed_sentiment = dict(self.current_sentiment)
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.web_monitor.update_snapshot, snapshot
+            )
             
         except Exception as e:
             self.error_counts['monitor_update'] += 1
             self.logger.error(f"Error updating monitor: {e}")
 
+    async def _noop_update_monitor(self):
+        """Stand-in for update_monitor while no web monitor is running"""
+        return
+
     async def shutdown(self):
         """Shutdown the trading bot gracefully"""
         self.logger.info("Shutting down trading bot...")
         self.running = False
+        self._stop_event.set()
+        self._health_cache = (None, 0.0)  # Components are going down; don't serve stale health
         
         try:
             # Stop portfolio monitoring
@@ -224,38 +278,66 @@ class OptionsTradingBot2026:
         try:
             self.logger.info("Initializing trading bot...")
             
+            # Set up signal handlers on the loop asyncio.run() created
+            await self._setup_signal_handlers()
+            
             # Load configuration
-            self.config = ConfigLoader2026()
+            from config_2026.config_loader import get_config_loader
+            self.config = get_config_loader()
+            self._pv_ttl = self.config.get('portfolio_value_ttl', 5.0)
+            self._health_ttl = self.config.get('health_status_ttl', 0.5)
+            self._trading_interval = self.config.get('trading_cycle_interval', 300)
+            ibkr_host = self.config.get('ibkr_host', '127.0.0.1')
+            ibkr_port = self.config.get('ibkr_port', 4001)
+            ibkr_client_id = self.config.get('ibkr_client_id', 1)
+            ibkr_pool_size = self.config.get('ibkr_pool_size', 4)
+            web_monitor_port = self.config.get('web_monitor_port', 5001)
             self.logger.info("Configuration loaded")
             
             # Initialize IBKR client
+            from ibkr_client_2026.client import IBKRClient2026
             self.ibkr_client = IBKRClient2026(
-                host=self.config.get('ibkr_host', '127.0.0.1'),
-                port=self.config.get('ibkr_port', 4001),
-                client_id=self.config.get('ibkr_client_id', 1)
+                host=ibkr_host,
+                port=ibkr_port,
+                client_id=ibkr_client_id,
+                pool_size=ibkr_pool_size
             )
             await self.ibkr_client.connect()
             self.logger.info("Connected to IBKR Gateway")
             
             # Initialize risk management with real portfolio value (live account) and config
+            # Fetch the account value once and reuse it for risk setup and the monitor cache
             portfolio_val = await self.ibkr_client.get_account_value()
+            if portfolio_val > 0:
+                self._pv_cache = (portfolio_val, time.monotonic())
+                self.logger.info(f"Account value: ${portfolio_val:,.2f}")
+            from risk_mgmt_2026.risk_manager import RiskManager2026
+            from risk_mgmt_2026.portfolio_provider import PortfolioProvider2026
+            from risk_mgmt_2026.portfolio_monitor import PortfolioMonitor2026
             self.risk_manager = RiskManager2026(portfolio_val, config=self.config.get_all_config())
             self.portfolio_provider = PortfolioProvider2026(self.risk_manager)
             self.portfolio_monitor = PortfolioMonitor2026(self.risk_manager, self.ibkr_client)
             self.logger.info("Risk management initialized")
             
             # Initialize strategy modules
-            self.bull_module = BullModule2026(self.ibkr_client, self.portfolio_provider)
-            self.bear_module = BearModule2026(self.ibkr_client, self.portfolio_provider)
-            self.volatile_module = VolatileModule2026(self.ibkr_client, self.portfolio_provider)
+            from bull_module_2026.bull import BullModule2026
+            from bear_module_2026.bear import BearModule2026
+            from volatile_module_2026.volatile import VolatileModule2026
+            self.bull_module, self.bear_module, self.volatile_module = [
+                cls(self.ibkr_client, self.portfolio_provider)
+                for cls in (BullModule2026, BearModule2026, VolatileModule2026)
+            ]
             self.logger.info("Strategy modules initialized")
             
             # Initialize news handler and stock screener
+            from news_handler_2026.news import NewsHandler2026
+            from stock_screener_2026.screener import StockScreener2026
             self.news_handler = NewsHandler2026(self.ibkr_client)
             self.stock_screener = StockScreener2026(self.ibkr_client, self.portfolio_provider)
             self.logger.info("News handler and stock screener initialized")
             
             # Initialize execution engine
+            from execution_engine_2026.engine import ExecutionEngine2026
             self.execution_engine = ExecutionEngine2026(
                 self.ibkr_client,
                 self.risk_manager,
@@ -269,16 +351,18 @@ class OptionsTradingBot2026:
             self.logger.info("Execution engine initialized")
             
             # Start portfolio monitoring
-            await self.portfolio_monitor.start_monitoring()
+            self.portfolio_monitor.start_monitoring()
             self.logger.info("Portfolio monitoring started")
             
             # Initialize web monitor
+            from web_monitor_2026.monitor_server import BotMonitorServer
             self.web_monitor = BotMonitorServer(
                 bot_instance=self,
-                port=self.config.get('web_monitor_port', 5001)
+                port=web_monitor_port
             )
             self.web_monitor.start_server()
-            self.logger.info(f"Web monitor started on port {self.config.get('web_monitor_port', 5001)}")
+            self._update_monitor = self.update_monitor
+            self.logger.info(f"Web monitor started on port {web_monitor_port}")
             
             # Update initial health status
             health_status = await self.get_health_status()
@@ -292,21 +376,32 @@ class OptionsTradingBot2026:
             await self.shutdown()
             return False
 
-async def main():
-    # Set up logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        filename='options_bot_2026.log',
-        filemode='a'
-    )
+def setup_logging() -> logging.handlers.QueueListener:
+    """Route log records through a queue so file/console writes happen off the event loop"""
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    file_handler = logging.FileHandler('options_bot_2026.log', mode='a')
+    file_handler.setFormatter(formatter)
     
     # Also log to console
     console = logging.StreamHandler()
     console.setLevel(logging.INFO)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     console.setFormatter(formatter)
-    logging.getLogger('').addHandler(console)
+    
+    log_queue = queue.SimpleQueue()  # Reentrant put(): safe when a signal handler logs
+    root = logging.getLogger('')
+    # DEBUG is opt-in: at DEBUG ib_insync logs every tick for every subscription
+    root.setLevel(logging.DEBUG if os.environ.get('OPTIONS_BOT_DEBUG') else logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    logging.getLogger('ib_insync').setLevel(logging.WARNING)
+    
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console, respect_handler_level=True)
+    listener.start()
+    return listener
+
+async def main():
+    # Set up logging
+    log_listener = setup_logging()
     
     # Create the bot
     bot = OptionsTradingBot2026()
@@ -326,9 +421,18 @@ async def main():
         logging.error(f"Fatal error: {e}", exc_info=True)
     finally:
         # Cleanup
-        await bot.shutdown()
+        with contextlib.suppress(asyncio.CancelledError):
+            await bot.shutdown()
+        log_listener.stop()
 
 if __name__ == "__main__":
+    # Prefer uvloop's faster event loop when available; fall back to asyncio's default
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Use asyncio.run() which properly manages the event loop
     try:
         asyncio.run(main())
@@ -5,25 +5,32 @@ Uses only the clean components without any errors
 """
 
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 import signal
-import time
+import threading
 from datetime import datetime
 
 # Add project root to path
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('clean_bot.log')
-    ]
-)
+# Setup logging - records are queued and written by a listener thread
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler('clean_bot.log')
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()  # Reentrant put(): safe when a signal handler logs
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+log_listener.start()
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +41,15 @@ class CleanTradingBot:
     def __init__(self):
         self.logger = logger
         self.running = False
+        self._stop = threading.Event()  # Set by signal handler/shutdown to wake run()
         self.ibkr_client = None
         self.thread_safe_wrapper = None
         
+    def _on_ibkr_disconnect(self):
+        """Stop the main loop when IBKR drops the connection"""
+        self.logger.error("Lost connection to IBKR")
+        self._stop.set()
+        
     def initialize(self):
         """Initialize the bot"""
         try:
@@ -57,6 +70,7 @@ class CleanTradingBot:
             from async_handler_2026 import create_sync_ibkr_client
             self.ibkr_client = create_sync_ibkr_client()
             self.ibkr_client.connect()
+            self.ibkr_client.on_disconnect = self._on_ibkr_disconnect
             self.logger.info("Connected to IBKR Gateway")
             
             # Get account value
@@ -105,14 +119,13 @@ class CleanTradingBot:
         """Run the bot"""
         self.running = True
         try:
-            while self.running:
+            # initialize() just logged the account value, so wait before the first check
+            while not self._stop.wait(timeout=30):  # Wait 30 seconds between checks
                 # Test basic functionality
                 if self.ibkr_client and self.ibkr_client.connected:
                     account_value = self.ibkr_client.get_account_value()
                     self.logger.info(f"Account value: ${account_value:,.2f}")
                 
-                time.sleep(30)  # Wait 30 seconds between checks
-                
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received")
         except Exception as e:
@@ -124,9 +137,11 @@ class CleanTradingBot:
         """Shutdown the bot"""
         self.logger.info("Shutting down clean trading bot...")
         self.running = False
+        self._stop.set()
         
         try:
             if self.ibkr_client:
+                self.ibkr_client.on_disconnect = None  # Deliberate disconnect, not a lost connection
                 self.ibkr_client.disconnect()
                 
         except Exception as e:
@@ -138,6 +153,7 @@ class CleanTradingBot:
         """Handle shutdown signals"""
         self.logger.info(f"Received signal {signum}, shutting down...")
         self.running = False
+        self._stop.set()
 
 
 def main():
@@ -148,11 +164,14 @@ def main():
     signal.signal(signal.SIGTERM, bot.signal_handler)
     signal.signal(signal.SIGINT, bot.signal_handler)
     
-    if bot.initialize():
-        bot.run()
-    else:
-        print("❌ Bot initialization failed")
-        sys.exit(1)
+    try:
+        if bot.initialize():
+            bot.run()
+        else:
+            print("❌ Bot initialization failed")
+            sys.exit(1)
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
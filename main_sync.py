@@ -5,21 +5,13 @@ This version uses synchronous code throughout for better stability
 """
 
 import logging
-import time
+import logging.handlers
+import os
+import queue
 import sys
 import signal
+import threading
 from datetime import datetime
-from async_handler_2026 import create_sync_ibkr_client
-from config_2026.config_loader import ConfigLoader2026
-from risk_mgmt_2026.risk_manager import RiskManager2026
-from risk_mgmt_2026.portfolio_provider import PortfolioProvider2026
-from risk_mgmt_2026.portfolio_monitor import PortfolioMonitor2026
-from bull_module_2026.bull import BullModule2026
-from bear_module_2026.bear import BearModule2026
-from volatile_module_2026.volatile import VolatileModule2026
-from news_handler_2026.news import NewsHandler2026
-from stock_screener_2026.screener import StockScreener2026
-from execution_engine_2026.sync_engine import SyncExecutionEngine2026
 
 
 class OptionsTradingBot2026:
@@ -28,6 +20,7 @@ class OptionsTradingBot2026:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.running = False
+        self._stop = threading.Event()  # Set by signal handler/shutdown to wake run()
         self.config = None
         self.ibkr_client = None
         self.portfolio_provider = None
@@ -46,6 +39,12 @@ class OptionsTradingBot2026:
         """Handle shutdown signals"""
         self.logger.info(f"Received signal {signum}, shutting down...")
         self.running = False
+        self._stop.set()
+        
+    def _on_ibkr_disconnect(self):
+        """Stop the main loop when IBKR drops the connection"""
+        self.logger.error("Lost connection to IBKR")
+        self._stop.set()
         
     def initialize(self):
         """Initialize all bot components"""
@@ -53,29 +52,36 @@ class OptionsTradingBot2026:
             self.logger.info("Initializing trading bot...")
             
             # Load configuration
-            config_loader = ConfigLoader2026()
+            from config_2026.config_loader import get_config_loader
+            config_loader = get_config_loader()
             self.config = config_loader.get_all_config()
             self.logger.info("Configuration loaded")
             
             # Initialize IBKR client with sync wrapper
+            from async_handler_2026 import create_sync_ibkr_client
             self.ibkr_client = create_sync_ibkr_client(
                 host=self.config['IBKR_HOST'],
                 port=self.config['IBKR_PORT'],
                 client_id=self.config['IBKR_CLIENT_ID']
             )
             
-            # Connect to IBKR
+            # Connect to IBKR; a dropped connection wakes the main loop
             self.ibkr_client.connect()
+            self.ibkr_client.on_disconnect = self._on_ibkr_disconnect
             self.logger.info("Connected to IBKR Gateway")
             
-            # Wait for connection to stabilize
-            time.sleep(1)
+            # Wait for account data instead of a fixed delay
+            if not self.ibkr_client.wait_until_ready(timeout=10.0):
+                self.logger.warning("IBKR account data not ready after 10s, continuing")
             
-            # Verify connection
+            # Verify connection; this single fetch also seeds the risk manager
             account_value = self.ibkr_client.get_account_value()
             self.logger.info(f"Account value: ${account_value:,.2f}")
             
             # Initialize risk manager with portfolio value and config
+            from risk_mgmt_2026.risk_manager import RiskManager2026
+            from risk_mgmt_2026.portfolio_provider import PortfolioProvider2026
+            from risk_mgmt_2026.portfolio_monitor import PortfolioMonitor2026
             self.risk_manager = RiskManager2026(
                 account_value if account_value > 0 else self.config.get('INITIAL_PORTFOLIO_VALUE', 10000),
                 config=self.config
@@ -92,17 +98,21 @@ class OptionsTradingBot2026:
             )
             
             # Initialize strategies (bull/bear/volatile modules need ibkr_client and portfolio_provider)
+            from bull_module_2026.bull import BullModule2026
+            from bear_module_2026.bear import BearModule2026
+            from volatile_module_2026.volatile import VolatileModule2026
             self.strategies = [
-                BullModule2026(self.ibkr_client, self.portfolio_provider),
-                BearModule2026(self.ibkr_client, self.portfolio_provider),
-                VolatileModule2026(self.ibkr_client, self.portfolio_provider)
+                cls(self.ibkr_client, self.portfolio_provider)
+                for cls in (BullModule2026, BearModule2026, VolatileModule2026)
             ]
             self.logger.info("Strategy modules initialized")
             
             # Initialize news analyzer (only needs ibkr_client)
+            from news_handler_2026.news import NewsHandler2026
             self.news_analyzer = NewsHandler2026(self.ibkr_client)
             
             # Initialize stock screener (needs ibkr_client and portfolio_provider)
+            from stock_screener_2026.screener import StockScreener2026
             self.stock_screener = StockScreener2026(
                 ibkr_client=self.ibkr_client,
                 portfolio_provider=self.portfolio_provider
@@ -110,6 +120,7 @@ class OptionsTradingBot2026:
             self.logger.info("News handler and stock screener initialized")
             
             # Initialize execution engine (sync version)
+            from execution_engine_2026.sync_engine import SyncExecutionEngine2026
             self.execution_engine = SyncExecutionEngine2026(
                 config=self.config,
                 ibkr_client=self.ibkr_client,
@@ -140,11 +151,9 @@ class OptionsTradingBot2026:
         self.execution_engine.start()
         
         try:
-            while self.running:
-                # Main loop - the execution engine handles the trading logic
-                time.sleep(1)
-                
-                # Check if we're still connected
+            # Main loop - the execution engine handles the trading logic.
+            # Disconnects wake us via on_disconnect; the poll is only a backstop.
+            while not self._stop.wait(timeout=30):
                 if not self.ibkr_client.connected:
                     self.logger.error("Lost connection to IBKR")
                     break
@@ -160,6 +169,7 @@ class OptionsTradingBot2026:
         """Shutdown all bot components"""
         self.logger.info("Shutting down trading bot...")
         self.running = False
+        self._stop.set()
         
         # Stop components in reverse order
         if self.portfolio_monitor:
@@ -169,27 +179,38 @@ class OptionsTradingBot2026:
             self.execution_engine.stop()
             
         if self.ibkr_client:
+            self.ibkr_client.on_disconnect = None  # Deliberate disconnect, not a lost connection
             self.ibkr_client.disconnect()
             
         self.logger.info("Trading bot shutdown complete")
 
 
-def setup_logging():
-    """Configure logging"""
+def setup_logging() -> logging.handlers.QueueListener:
+    """Configure logging; file/console writes happen on a listener thread"""
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    logging.basicConfig(
-        level=logging.INFO,
-        format=log_format,
-        handlers=[
-            logging.FileHandler('options_bot_2026_sync.log'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    formatter = logging.Formatter(log_format)
+    handlers = [
+        logging.FileHandler('options_bot_2026_sync.log'),
+        logging.StreamHandler(sys.stdout)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()  # Reentrant put(): safe when a signal handler logs
+    root = logging.getLogger()
+    # DEBUG is opt-in: at DEBUG ib_insync logs every tick for every subscription
+    root.setLevel(logging.DEBUG if os.environ.get('OPTIONS_BOT_DEBUG') else logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    logging.getLogger('ib_insync').setLevel(logging.WARNING)
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    return listener
 
 
 def main():
     """Main entry point"""
-    setup_logging()
+    log_listener = setup_logging()
     logger = logging.getLogger(__name__)
     
     logger.info("="*60)
@@ -199,12 +220,15 @@ def main():
     
     bot = OptionsTradingBot2026()
     
-    if bot.initialize():
-        bot.run()
-    else:
-        logger.error("Bot initialization failed")
-        bot.shutdown()
-        sys.exit(1)
+    try:
+        if bot.initialize():
+            bot.run()
+        else:
+            logger.error("Bot initialization failed")
+            bot.shutdown()
+            sys.exit(1)
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -10,33 +10,82 @@ import sys
 import os
 import signal
 import logging
+import logging.handlers
+import queue
 import time
-from typing import Dict, List, Any
-import random
+from typing import Dict, List, Any, Optional
 import threading
+import secrets
+import asyncio
+from concurrent.futures import Future
+from dataclasses import dataclass
 
-# Add the project directory to sys.path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Strategy labels for web monitor positions, keyed by (secType, direction/right)
+_STRATEGY_MAP = {
+    ('BAG', 1): 'bull_spread',
+    ('BAG', -1): 'bear_spread',
+    ('OPT', 'C'): 'call_option',
+    ('OPT', 'P'): 'put_option',
+}
 
-# Configure logging first
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('options_bot_2026_live.log'),
-        logging.StreamHandler()
-    ]
+# Health flags reported to the web monitor (all False unless proven healthy)
+_HEALTH_KEYS = (
+    'ibkr_connection',
+    'execution_engine',
+    'risk_manager',
+    'portfolio_provider',
+    'news_handler',
+    'stock_screener',
+)
+
+# Position fields must be plain numbers to be formatted for the dashboard
+_NUMERIC = (int, float)
+
+
+@dataclass(frozen=True)
+class DashboardSnapshot:
+    """Dashboard values from one refresh, published as a single reference"""
+    portfolio_value: float
+    trades: tuple
+    risk: dict
+    health: dict
+
+    def as_dict(self) -> dict:
+        """Snapshot in the key layout BotMonitorServer.update_snapshot expects"""
+        return {
+            'portfolio_value': self.portfolio_value,
+            'active_trades': list(self.trades),
+            'risk_metrics': self.risk,
+            'health_status': self.health
+        }
+
+
+# Published before the first refresh so the web getters never fall back to IBKR
+_EMPTY_SNAPSHOT = DashboardSnapshot(
+    portfolio_value=0.0,
+    trades=(),
+    risk={'max_trade_size': 0, 'daily_loss': 0, 'active_trailing_stops': 0},
+    health=dict.fromkeys(_HEALTH_KEYS, False)
 )
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals gracefully"""
-    logger = logging.getLogger(__name__)
-    logger.info(f"Received signal {signum}, shutting down...")
-    sys.exit(0)
+# Add the project directory to sys.path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Bot components (resolved once at startup, before live trading begins)
+from config_2026.config_loader import get_config_loader
+from async_handler_2026 import create_sync_ibkr_client
+from thread_safe_ibkr_wrapper import ThreadSafeIBKRWrapper
+from async_sync_adapter import AsyncSyncAdapter
+from risk_mgmt_2026.risk_manager import RiskManager2026
+from risk_mgmt_2026.portfolio_provider import PortfolioProvider2026
+from bull_module_2026.bull import BullModule2026
+from bear_module_2026.bear import BearModule2026
+from volatile_module_2026.volatile import VolatileModule2026
+from news_handler_2026.news import NewsHandler2026
+from stock_screener_2026.screener import StockScreener2026
+from execution_engine_2026.sync_engine import SyncExecutionEngine2026
+from web_monitor_2026.monitor_server import BotMonitorServer
 
-# Register signal handlers
-signal.signal(signal.SIGTERM, signal_handler)
-signal.signal(signal.SIGINT, signal_handler)
 
 class TradingBotMain:
     """
@@ -53,16 +102,44 @@ class TradingBotMain:
     6. Web Monitor → Dashboard
     """
     
+    # Fixed attribute set: faster attribute reads in the web monitor polls
+    __slots__ = (
+        'logger', 'config', 'ibkr_client', 'thread_safe_client', 'async_adapter',
+        'risk_manager', 'portfolio_provider', 'strategies', 'news_handler',
+        'stock_screener', 'execution_engine', 'web_monitor', '_web_future',
+        '_stop_event', '_acct_value_cache', '_acct_value_ttl', '_acct_value_lock', '_snapshot',
+        '_health_cache',
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.config = {}
         self.ibkr_client = None
         self.thread_safe_client = None
+        self.async_adapter = None
         self.risk_manager = None
         self.portfolio_provider = None
         self.strategies = []
+        self.news_handler = None
+        self.stock_screener = None
         self.execution_engine = None
         self.web_monitor = None
+        self._web_future: Optional[Future] = None  # Done once the web server thread exits
+        self._stop_event = threading.Event()  # Set by signal_handler/shutdown to release run()
+        
+        # Account value cache shared by startup, the banner and web monitor polls
+        self._acct_value_cache = (0.0, 0.0)  # (value, monotonic timestamp)
+        self._acct_value_ttl = 2.0  # seconds
+        self._acct_value_lock = threading.Lock()  # One IBKR fetch per expiry across threads
+        
+        # Latest dashboard values; replaced wholesale by get_dashboard_snapshot
+        self._snapshot = _EMPTY_SNAPSHOT
+        self._health_cache = ((), {})  # (flags tuple, status dict) from the last health check
+        
+    def signal_handler(self, signum, frame):
+        """Handle shutdown signals gracefully"""
+        self.logger.info(f"Received signal {signum}, shutting down...")
+        self._stop_event.set()
         
     def initialize(self):
         """Initialize all components with proper dependency injection"""
@@ -89,14 +166,14 @@ class TradingBotMain:
             self._initialize_support_components()
             self.logger.info("News handler and stock screener initialized")
             
-            # Step 6: Initialize execution engine
-            self._initialize_execution_engine()
-            self.logger.info("Execution engine initialized")
-            
-            # Step 7: Initialize web monitor
+            # Step 6: Initialize web monitor (BEFORE execution engine, which reports to it)
             self._initialize_web_monitor()
             self.logger.info(f"Web monitor started at http://localhost:5001")
             
+            # Step 7: Initialize execution engine
+            self._initialize_execution_engine()
+            self.logger.info("Execution engine initialized")
+            
             self.logger.info("Trading bot started")
             return True
             
@@ -106,20 +183,19 @@ class TradingBotMain:
     
     def _load_configuration(self):
         """Load configuration from environment and defaults"""
-        from config_2026.config_loader import ConfigLoader2026
-        
-        config_loader = ConfigLoader2026()
+        config_loader = get_config_loader()
         self.config = config_loader.get_all_config()
     
     def _connect_to_ibkr(self):
         """Establish IBKR connection with proper client hierarchy"""
-        from async_handler_2026 import create_sync_ibkr_client
-        from thread_safe_ibkr_wrapper import ThreadSafeIBKRWrapper
-        from async_sync_adapter import AsyncSyncAdapter
-        
-        # Create unique client ID for this session
-        client_id = random.randint(100, 999)
-        self.logger.info(f"Using dynamic client ID: {client_id}")
+        # Create unique client ID for this session from pid, start time and
+        # random bits. Spans the full positive 32-bit range IBKR accepts, so a
+        # restart won't land on the slot the gateway may still hold for us and
+        # bots started in the same second (even on other hosts) won't collide.
+        # 0 is avoided: IBKR treats it as the master client.
+        pid, started, salt = os.getpid(), int(time.time()), secrets.randbits(31)
+        client_id = ((pid ^ started ^ salt) & 0x7FFFFFFF) or 1
+        self.logger.info(f"Using dynamic client ID: {client_id} (pid={pid}, time={started}, salt={salt})")
         
         # Layer 1: Core IBKR sync client (NO TESTING CODE)
         self.ibkr_client = create_sync_ibkr_client(
@@ -129,11 +205,12 @@ class TradingBotMain:
         )
         self.ibkr_client.connect()
         
-        # Wait for connection to stabilize
-        time.sleep(2)
+        # Wait for account data instead of a fixed delay
+        if not self.ibkr_client.wait_until_ready(timeout=10.0):
+            self.logger.warning("IBKR account data not ready after 10s, continuing")
         
         # Get account value for risk management
-        account_value = self.ibkr_client.get_account_value()
+        account_value = self._cached_account_value()
         self.logger.info(f"Account value: ${account_value:,.2f}")
         
         # Layer 2: Thread-safe wrapper (provides calculate_max_trade_size, is_trading_halted)
@@ -146,11 +223,8 @@ class TradingBotMain:
     
     def _initialize_risk_management(self):
         """Initialize risk management BEFORE portfolio provider"""
-        from risk_mgmt_2026.risk_manager import RiskManager2026
-        from risk_mgmt_2026.portfolio_provider import PortfolioProvider2026
-        
         # Get current account value
-        account_value = self.ibkr_client.get_account_value()
+        account_value = self._cached_account_value()
         
         # Initialize risk manager FIRST (with account value and config)
         self.risk_manager = RiskManager2026(
@@ -163,10 +237,6 @@ class TradingBotMain:
     
     def _initialize_strategies(self):
         """Initialize strategy modules with proper dependencies"""
-        from bull_module_2026.bull import BullModule2026
-        from bear_module_2026.bear import BearModule2026
-        from volatile_module_2026.volatile import VolatileModule2026
-        
         # All strategies use async_adapter (which includes thread-safe wrapper)
         # This ensures they have access to all required methods:
         # - calculate_max_trade_size (from thread-safe wrapper)
@@ -181,9 +251,6 @@ class TradingBotMain:
     
     def _initialize_support_components(self):
         """Initialize news handler and stock screener"""
-        from news_handler_2026.news import NewsHandler2026
-        from stock_screener_2026.screener import StockScreener2026
-        
         # News handler for sentiment analysis (expects ibkr_client, not config)
         self.news_handler = NewsHandler2026(self.async_adapter)
         
@@ -195,8 +262,6 @@ class TradingBotMain:
     
     def _initialize_execution_engine(self):
         """Initialize execution engine that orchestrates everything"""
-        from execution_engine_2026.sync_engine import SyncExecutionEngine2026
-        
         # Execution engine coordinates all components
         self.execution_engine = SyncExecutionEngine2026(
             config=self.config,
@@ -204,27 +269,32 @@ class TradingBotMain:
             strategies=self.strategies,
             news_analyzer=self.news_handler,
             stock_screener=self.stock_screener,
-            web_monitor=None  # Will be set after web monitor is created
+            web_monitor=self.web_monitor
         )
     
     def _initialize_web_monitor(self):
         """Initialize web monitoring dashboard"""
-        from web_monitor_2026.monitor_server import BotMonitorServer
-        
         # Create web monitor with the correct arguments
         self.web_monitor = BotMonitorServer(
             bot_instance=self,
             port=self.config.get('WEB_MONITOR_PORT', 5001)
         )
         
-        # Link web monitor to execution engine
-        self.execution_engine.web_monitor = self.web_monitor
+        # Start web server in a named background thread; its outcome is
+        # mirrored into a Future so the server's health can be checked
+        self._web_future = Future()
         
-        # Start web server in a background thread
         def start_web_server():
-            self.web_monitor.start_server()
+            self._web_future.set_running_or_notify_cancel()
+            try:
+                self.web_monitor.start_server()
+            except Exception as e:
+                self.logger.error(f"Web monitor server stopped with error: {e}", exc_info=True)
+                self._web_future.set_exception(e)
+            else:
+                self._web_future.set_result(None)
         
-        web_thread = threading.Thread(target=start_web_server, daemon=True)
+        web_thread = threading.Thread(target=start_web_server, name='web-monitor', daemon=True)
         web_thread.start()
         
         self.logger.info(f"🖥️ Web monitor starting at http://localhost:{self.config.get('WEB_MONITOR_PORT', 5001)}")
@@ -236,7 +306,7 @@ class TradingBotMain:
             self.logger.info("============================================================")
             self.logger.info("🚀 Options Trading Bot 2026 is now LIVE!")
             self.logger.info("📊 Web Monitor: http://localhost:5001")
-            self.logger.info(f"💰 Account Value: ${self.ibkr_client.get_account_value():,.2f}")
+            self.logger.info(f"💰 Account Value: ${self._cached_account_value():,.2f}")
             self.logger.info("⏰ Market Hours: 9:30 AM - 4:00 PM ET")
             self.logger.info("============================================================")
             
@@ -247,9 +317,14 @@ class TradingBotMain:
             # Start execution engine
             self.execution_engine.start()
             
-            # Keep the main thread alive
-            while True:
-                time.sleep(1)
+            # Keep the main thread alive until a signal or shutdown releases it,
+            # waking periodically to shut down if the execution engine has died
+            while not self._stop_event.wait(5.0):
+                if not self.execution_engine.alive:
+                    self.logger.error("Execution engine stopped unexpectedly, shutting down")
+                    if self.web_monitor:
+                        self.web_monitor.update_bot_status("Error")
+                    break
                 
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received")
@@ -265,6 +340,7 @@ class TradingBotMain:
     def shutdown(self):
         """Gracefully shutdown all components"""
         self.logger.info("Shutting down trading bot...")
+        self._stop_event.set()
         
         # Update web monitor that bot is shutting down
         if self.web_monitor:
@@ -292,93 +368,129 @@ class TradingBotMain:
         
         self.logger.info("Trading bot shutdown complete")
 
+    def _cached_account_value(self) -> float:
+        """Get the account value, reusing a recent IBKR answer within the TTL"""
+        with self._acct_value_lock:
+            value, fetched_at = self._acct_value_cache
+            now = time.monotonic()
+            if fetched_at and now - fetched_at < self._acct_value_ttl:
+                return value
+            
+            value = self.ibkr_client.get_account_value()
+            self._acct_value_cache = (value, time.monotonic())
+            return value
+
+    def _fetch_account_state(self) -> tuple:
+        """Fetch account value and positions together (runs in an executor)"""
+        snap = self.thread_safe_client.snapshot()
+        
+        # The fresh value also serves _cached_account_value readers
+        with self._acct_value_lock:
+            self._acct_value_cache = (snap['account_value'], time.monotonic())
+        return snap['account_value'], snap['positions']
+
     # Web monitor interface methods
+    # The per-field getters only read the published snapshot; all IBKR and
+    # risk manager reads happen in get_dashboard_snapshot
     async def get_portfolio_value(self) -> float:
         """Get current portfolio value for web monitor"""
-        try:
-            if self.ibkr_client:
-                return self.ibkr_client.get_account_value()
-            return 0.0
-        except Exception as e:
-            self.logger.error(f"Error getting portfolio value: {e}")
-            return 0.0
+        return self._snapshot.portfolio_value
 
     async def get_active_trades(self) -> list:
         """Get active trades for web monitor"""
+        return list(self._snapshot.trades)
+
+    def _format_positions(self, positions) -> list:
+        """Convert IBKR positions into web monitor trade rows"""
+        rows = [self._format_position(pos) for pos in positions]
+        return [row for row in rows if row is not None]
+
+    def _format_position(self, pos) -> Optional[dict]:
+        """Format one position; returns None for rows with bad numeric fields"""
+        # Read each attribute once
+        contract = getattr(pos, 'contract', None)
+        symbol = getattr(contract, 'symbol', 'Unknown')
+        position_size = getattr(pos, 'position', 0)
+        current_value = getattr(pos, 'marketValue', 0)
+        avg_cost = getattr(pos, 'avgCost', 0)
+        unrealized_pnl = getattr(pos, 'unrealizedPNL', 0)
+        
+        if not all(isinstance(v, _NUMERIC) for v in (position_size, current_value, avg_cost, unrealized_pnl)):
+            self.logger.error(f"Error formatting position {symbol}: non-numeric position data")
+            return None
+        
+        # Calculate entry price and current price estimates
+        if position_size != 0:
+            abs_pos = abs(position_size)
+            entry_price = abs(avg_cost)
+            basis = entry_price * abs_pos * 100.0
+            current_price = entry_price + unrealized_pnl / (abs_pos * 100.0)
+            pnl_pct = unrealized_pnl / basis * 100.0 if basis else 0
+        else:
+            entry_price = current_price = pnl_pct = 0
+        
+        # Determine strategy type from contract
+        if contract is None:
+            strategy = 'unknown'
+        else:
+            sec_type = getattr(contract, 'secType', '')
+            if sec_type == 'BAG':
+                # Options spread: direction from position sign
+                strategy = _STRATEGY_MAP[('BAG', 1 if position_size > 0 else -1)]
+            elif sec_type == 'OPT':
+                # Single option
+                strategy = _STRATEGY_MAP.get(('OPT', getattr(contract, 'right', '')), 'option')
+            else:
+                strategy = 'stock'
+        
+        return {
+            'symbol': symbol,
+            'strategy': strategy,
+            'position_size': position_size,
+            'entry_price': entry_price,
+            'current_price': current_price,
+            'current_value': current_value,
+            'pnl': unrealized_pnl,
+            'pnl_pct': pnl_pct,  # Number; the dashboard formats it
+            'avg_cost': avg_cost
+        }
+
+    async def get_dashboard_snapshot(self) -> dict:
+        """Refresh all web monitor fields from a single IBKR round-trip.
+
+        The result is also published as the snapshot the per-field getters
+        serve, so they never do I/O of their own.
+        """
+        portfolio_value, active_trades = 0.0, []
         try:
-            if not self.ibkr_client:
-                return []
-                
-            positions = self.ibkr_client.get_positions()
-            formatted_trades = []
-            
-            for pos in positions:
-                try:
-                    # Get basic position info
-                    symbol = pos.contract.symbol if hasattr(pos, 'contract') else 'Unknown'
-                    position_size = getattr(pos, 'position', 0)
-                    current_value = getattr(pos, 'marketValue', 0)
-                    avg_cost = getattr(pos, 'avgCost', 0)
-                    unrealized_pnl = getattr(pos, 'unrealizedPNL', 0)
-                    
-                    # Calculate entry price and current price estimates
-                    if position_size != 0:
-                        entry_price = abs(avg_cost)
-                        current_price = entry_price + (unrealized_pnl / abs(position_size) / 100)
-                        pnl_pct = (unrealized_pnl / (abs(avg_cost * position_size * 100))) * 100 if avg_cost != 0 else 0
-                    else:
-                        entry_price = current_price = pnl_pct = 0
-                    
-                    # Determine strategy type from contract
-                    strategy = 'unknown'
-                    if hasattr(pos, 'contract'):
-                        if getattr(pos.contract, 'secType', '') == 'BAG':
-                            # Options spread
-                            if position_size > 0:
-                                strategy = 'bull_spread'  
-                            else:
-                                strategy = 'bear_spread'
-                        elif getattr(pos.contract, 'secType', '') == 'OPT':
-                            # Single option
-                            right = getattr(pos.contract, 'right', '')
-                            if right == 'C':
-                                strategy = 'call_option'
-                            elif right == 'P':
-                                strategy = 'put_option'
-                            else:
-                                strategy = 'option'
-                        else:
-                            strategy = 'stock'
-                    
-                    formatted_trades.append({
-                        'symbol': symbol,
-                        'strategy': strategy,
-                        'position_size': position_size,
-                        'entry_price': entry_price,
-                        'current_price': current_price,
-                        'current_value': current_value,
-                        'pnl': unrealized_pnl,
-                        'pnl_pct': f"{pnl_pct:.2f}%",
-                        'avg_cost': avg_cost
-                    })
-                    
-                except Exception as e:
-                    self.logger.error(f"Error formatting position {symbol}: {e}")
-                    continue
-                    
-            return formatted_trades
-            
+            if self.thread_safe_client:
+                portfolio_value, positions = await asyncio.get_running_loop().run_in_executor(
+                    None, self._fetch_account_state
+                )
+                active_trades = self._format_positions(positions)
         except Exception as e:
-            self.logger.error(f"Error getting active trades: {e}")
-            return []
+            self.logger.error(f"Error getting dashboard snapshot: {e}")
+        
+        snapshot = DashboardSnapshot(
+            portfolio_value=portfolio_value,
+            trades=tuple(active_trades),
+            risk=self._compute_risk_metrics(),
+            health=self._compute_health_status()
+        )
+        self._snapshot = snapshot  # Single reference swap; readers never see a partial update
+        return snapshot.as_dict()
 
     async def get_risk_metrics(self) -> dict:
         """Get risk metrics for web monitor"""
+        return self._snapshot.risk
+
+    def _compute_risk_metrics(self) -> dict:
+        """Read risk metrics from the risk manager"""
         try:
             if self.risk_manager:
                 metrics = self.risk_manager.get_risk_metrics()
                 # Add additional fields expected by web monitor
-                metrics['active_trailing_stops'] = len(getattr(self.risk_manager, 'trailing_stops', {}))
+                metrics['active_trailing_stops'] = self.risk_manager.active_trailing_stops
                 return metrics
             return {
                 'max_trade_size': 0,
@@ -395,25 +507,33 @@ class TradingBotMain:
 
     async def get_health_status(self) -> dict:
         """Get health status for web monitor"""
+        return self._snapshot.health
+
+    def _compute_health_status(self) -> dict:
+        """Check which components are up; unchanged results reuse the same dict"""
         try:
-            return {
-                'ibkr_connection': getattr(self.ibkr_client, 'connected', False) if self.ibkr_client else False,
-                'execution_engine': self.execution_engine.running if self.execution_engine else False,
-                'risk_manager': True if self.risk_manager else False,
-                'portfolio_provider': True if self.portfolio_provider else False,
-                'news_handler': True if hasattr(self, 'news_handler') else False,
-                'stock_screener': True if hasattr(self, 'stock_screener') else False
-            }
+            # Same order as _HEALTH_KEYS
+            flags = (
+                bool(self.ibkr_client and getattr(self.ibkr_client, 'connected', False)),
+                bool(self.execution_engine and self.execution_engine.running),
+                bool(self.risk_manager),
+                bool(self.portfolio_provider),
+                self.news_handler is not None,
+                self.stock_screener is not None,
+            )
         except Exception as e:
             self.logger.error(f"Error getting health status: {e}")
-            return {
-                'ibkr_connection': False,
-                'execution_engine': False,
-                'risk_manager': False,
-                'portfolio_provider': False,
-                'news_handler': False,
-                'stock_screener': False
-            }
+            flags = (False,) * len(_HEALTH_KEYS)
+        
+        cached_flags, cached_status = self._health_cache
+        if flags == cached_flags:
+            return cached_status
+        
+        # Build a new dict rather than mutating the cached one, which may
+        # still be referenced by a published DashboardSnapshot
+        status = dict(zip(_HEALTH_KEYS, flags))
+        self._health_cache = (flags, status)
+        return status
 
     # Additional web monitor helper methods
     def log_trade_action(self, action_type: str, symbol: str, strategy: str, details: dict):
@@ -432,8 +552,82 @@ class TradingBotMain:
             self.web_monitor.update_market_sentiment(sentiment_data)
 
 
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating log file written through a 64 KiB buffer
+    
+    ERROR and above are flushed immediately for post-mortems; anything
+    else is flushed by a background thread within flush_interval seconds,
+    so the tail of a burst never waits for the next record. Rollover and
+    close() flush whatever is still buffered.
+    """
+    
+    def __init__(self, *args, flush_interval: float = 1.0, **kwargs):
+        self._flush_interval = flush_interval
+        self._urgent = False
+        self._dirty = False  # Records written since the last flush
+        self._flush_stop = threading.Event()
+        super().__init__(*args, **kwargs)
+        threading.Thread(target=self._flush_periodically, name='log-flush', daemon=True).start()
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=1 << 16,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        self._urgent = record.levelno >= logging.ERROR
+        super().emit(record)
+    
+    def flush(self):
+        # Called after every emit; only ERROR records force the buffer out here
+        if self._urgent:
+            super().flush()
+            self._dirty = False
+        else:
+            self._dirty = True
+    
+    def _flush_periodically(self):
+        while not self._flush_stop.wait(self._flush_interval):
+            if not self._dirty:
+                continue
+            self.acquire()
+            try:
+                super().flush()
+                self._dirty = False
+            finally:
+                self.release()
+    
+    def close(self):
+        self._flush_stop.set()
+        super().close()
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """Configure logging; file/console writes happen on a listener thread"""
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        _BufferedRotatingFileHandler('options_bot_2026_live.log', maxBytes=50_000_000, backupCount=5),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    # DEBUG is opt-in: at DEBUG ib_insync logs every tick for every subscription
+    root.setLevel(logging.DEBUG if os.environ.get('OPTIONS_BOT_DEBUG') else logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    logging.getLogger('ib_insync').setLevel(logging.WARNING)
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    return listener
+
+
 def main():
     """Main entry point"""
+    log_listener = setup_logging()
+    
     # Print startup banner
     print("============================================================")
     print("🚀 OPTIONS TRADING BOT 2026 - LIVE MODE")
@@ -444,11 +638,18 @@ def main():
     # Create and run the bot
     bot = TradingBotMain()
     
-    if bot.initialize():
-        bot.run()
-    else:
-        print("❌ Bot initialization failed")
-        sys.exit(1)
+    # Register signal handlers
+    signal.signal(signal.SIGTERM, bot.signal_handler)
+    signal.signal(signal.SIGINT, bot.signal_handler)
+    
+    try:
+        if bot.initialize():
+            bot.run()
+        else:
+            print("❌ Bot initialization failed")
+            sys.exit(1)
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -88,9 +88,16 @@ async def monitor_market():
                 candidates = await stock_screener.screen_stocks(sentiment)
                 if candidates:
                     print(f"\nFound {len(candidates)} candidate stocks:")
-                    for i, symbol in enumerate(candidates[:5], 1):
-                        market_data = await client.get_market_data(symbol)
-                        if market_data and market_data.get('last'):
+                    # Fetch quotes for the top candidates concurrently
+                    top = candidates[:5]
+                    quotes = await asyncio.gather(
+                        *(client.get_market_data(symbol) for symbol in top),
+                        return_exceptions=True
+                    )
+                    for i, (symbol, market_data) in enumerate(zip(top, quotes), 1):
+                        if isinstance(market_data, Exception):
+                            print(f"  {i}. {symbol}: (error: {market_data})")
+                        elif market_data and market_data.get('last'):
                             print(f"  {i}. {symbol}: ${market_data['last']:.2f}")
                         else:
                             print(f"  {i}. {symbol}: (no data)")
@@ -135,6 +142,13 @@ async def main():
     await monitor_market()
 
 if __name__ == "__main__":
+    # Prefer uvloop's faster event loop when available; fall back to asyncio's default
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -1,10 +1,74 @@
 # news_handler_2026/news.py
 import logging
-from datetime import datetime, timedelta
+import time
+from collections import Counter
+from datetime import datetime
 from ib_insync import Contract, NewsArticle
 from typing import Dict, List
 import asyncio
 
+# Sector ETFs used for sector sentiment
+SECTOR_ETFS = {
+    'technology': 'XLK',    # Technology Select Sector SPDR
+    'healthcare': 'XLV',    # Health Care Select Sector SPDR
+    'energy': 'XLE',        # Energy Select Sector SPDR
+    'financials': 'XLF',    # Financial Select Sector SPDR
+    'consumer_discretionary': 'XLY',  # Consumer Discretionary SPDR
+    'industrials': 'XLI'    # Industrial Select Sector SPDR
+}
+
+# Quarterly earnings seasons start in these months
+_EARNINGS_MONTHS = frozenset({1, 4, 7, 10})
+# FOMC typically meets 8 times per year, roughly every 6 weeks
+# Meeting dates are usually: Jan, Mar, May, Jun, Jul, Sep, Nov, Dec
+_FOMC_MONTHS = frozenset({1, 3, 5, 6, 7, 9, 11, 12})
+
+# Scores beyond +/- this are directional; within it the market is neutral or volatile
+SENTIMENT_THRESHOLD = 0.2
+
+def _classify_sentiment(score: float) -> str:
+    """Map a sentiment score to 'bullish', 'bearish' or 'neutral'"""
+    if score > SENTIMENT_THRESHOLD:
+        return 'bullish'
+    if score < -SENTIMENT_THRESHOLD:
+        return 'bearish'
+    return 'neutral'
+
+# Neutral sentiment returned when live analysis fails (timestamp added per call)
+_DEFAULT_SENTIMENT = {
+    'overall_sentiment': 'neutral',
+    'sentiment_score': 0.0,
+    'confidence': 0.5,
+    'volatility_expected': 0.5,
+    'bullish': False,
+    'bearish': False,
+    'volatile': False,
+    'neutral': True,
+    'sector_sentiment': dict.fromkeys(SECTOR_ETFS, 0.0),
+    'news_factors': {
+        'earnings_season': False,
+        'fed_announcement': False,
+        'geopolitical_risk': 0.0,
+        'market_events': [],
+        'vix_risk_level': 'medium',
+        'market_stress': False
+    },
+    'technical_sentiment': {
+        'vix_level': 20.0,
+        'bull_bear_ratio': 0.5,
+        'market_momentum': 0.0
+    },
+    'data_sources': ['default']
+}
+
+# (name, fallback) for each concurrent analysis in get_market_sentiment, in gather order
+_SENTIMENT_PARTS = (
+    ('market', {'sentiment': 'neutral', 'score': 0.0, 'confidence': 0.5}),
+    ('sector', _DEFAULT_SENTIMENT['sector_sentiment']),
+    ('technical', _DEFAULT_SENTIMENT['technical_sentiment']),
+    ('news factors', _DEFAULT_SENTIMENT['news_factors']),
+)
+
 class NewsHandler2026:
     """
     Handles news and sentiment analysis for Options Trading Bot 2026.
@@ -13,8 +77,8 @@ class NewsHandler2026:
         self.ibkr_client = ibkr_client
         self.logger = logging.getLogger(__name__)
         self.news_cache = {}
-        self.last_update = None
-        self.update_interval = timedelta(minutes=15)  # Fetch news every 15 minutes max
+        self.last_update = None  # time.monotonic() of the last index refresh
+        self.update_interval = 15 * 60.0  # Fetch news every 15 minutes max (seconds)
         self.max_lookback_days = 7  # Max 1 week of historical news
         self.max_results = 50  # Limit articles per request
         self.market_indexes = [
@@ -24,16 +88,36 @@ class NewsHandler2026:
             'IWM',  # Russell 2000
             'VIX',  # Volatility Index - needed for volatility strategy
         ]
-        self._request_timestamps = {}  # Track request timestamps for rate limiting
+        # Everything _update_market_data refreshes in one batch: (symbol, sec_type)
+        # for the indexes plus the sector ETFs
+        self._universe = [
+            (symbol, 'IND' if symbol == 'VIX' else 'STK')
+            for symbol in dict.fromkeys(self.market_indexes + list(SECTOR_ETFS.values()))
+        ]
+        self._request_timestamps: Dict[str, float] = {}  # symbol -> time.monotonic() of last request
+        self._max_tracked_symbols = 1024  # Prune stale rate limit entries beyond this
+        self.max_concurrent_requests = 8  # Cap on in-flight market data requests per fan-out
+        self.max_requests_per_second = 8.0  # Token bucket: sustained rate and burst size
+        self._request_tokens = self.max_requests_per_second
+        self._tokens_updated = time.monotonic()
+        self._sentiment_cache = (None, 0.0)  # (combined sentiment, monotonic expiry)
+        # Built once; the contract is the same on every call
+        self._spy_options_contract = Contract(symbol='SPY', secType='OPT', exchange='SMART', currency='USD')
 
     async def _rate_limit_check(self, symbol: str) -> bool:
         """Check if we need to rate limit requests for a symbol"""
-        now = datetime.now()
-        if symbol in self._request_timestamps:
-            last_request = self._request_timestamps[symbol]
-            if now - last_request < timedelta(minutes=15):
-                return False
+        now = time.monotonic()
+        last_request = self._request_timestamps.get(symbol)
+        if last_request is not None and now - last_request < self.update_interval:
+            return False
         self._request_timestamps[symbol] = now
+        
+        # Keep the map bounded for large symbol universes
+        if len(self._request_timestamps) > self._max_tracked_symbols:
+            cutoff = now - 2 * self.update_interval
+            self._request_timestamps = {
+                sym: ts for sym, ts in self._request_timestamps.items() if ts >= cutoff
+            }
         return True
 
     async def _get_news_with_rate_limit(self, contract: Contract) -> List[NewsArticle]:
@@ -41,86 +125,132 @@ class NewsHandler2026:
         if not await self._rate_limit_check(contract.symbol):
             return []
         
-        try:
-            # IBKR news API not available, return empty list
-            # We'll rely on market data analysis instead
-            await asyncio.sleep(0.1)  # Small delay for rate limiting
-            return []
-        except Exception as e:
-            self.logger.debug(f"News articles not available for {contract.symbol}: {e}")
-            return []
+        # IBKR news API not available, return empty list
+        # We'll rely on market data analysis instead; request pacing is
+        # handled by _acquire_request_token
+        return []
 
     async def get_market_sentiment(self):
         """
-        Get real market sentiment from IBKR data feeds
+        Get real market sentiment from IBKR data feeds.
+        The combined result is reused for update_interval, matching how
+        often the underlying index data is refreshed.
         """
+        cached, expires_at = self._sentiment_cache
+        if cached is not None and time.monotonic() < expires_at:
+            return cached
+        
         try:
-            await self._update_market_data()
-            market_sentiment = await self._analyze_market_sentiment()
-            sector_sentiment = await self._analyze_sector_sentiment()
-            technical_sentiment = await self._get_technical_sentiment()
+            # One clock read per snapshot, shared by every helper below
+            now = datetime.now()
+            await self._update_market_data(now)
+            # These only read the refreshed cache, so they can overlap
+            results = await asyncio.gather(
+                self._analyze_market_sentiment(),
+                self._analyze_sector_sentiment(),
+                self._get_technical_sentiment(),
+                self._get_news_factors(now),
+                return_exceptions=True
+            )
+            # A failed branch falls back to its neutral default without discarding the others
+            degraded = False
+            for i, result in enumerate(results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error in market sentiment analysis ({_SENTIMENT_PARTS[i][0]}): {result}")
+                    results[i] = _SENTIMENT_PARTS[i][1]
+                    degraded = True
+            market_sentiment, sector_sentiment, technical_sentiment, news_factors = results
+            # Reuse the classification from _analyze_market_sentiment
+            overall = market_sentiment['sentiment']
+            abs_score = abs(market_sentiment['score'])
+            vix_level = technical_sentiment['vix_level']
             combined_sentiment = {
-                'overall_sentiment': market_sentiment['sentiment'],
+                'overall_sentiment': overall,
                 'sentiment_score': market_sentiment['score'],
                 'confidence': market_sentiment['confidence'],
-                'volatility_expected': technical_sentiment['vix_level'] / 20,
-                'bullish': market_sentiment['score'] > 0.2,
-                'bearish': market_sentiment['score'] < -0.2,
-                'volatile': abs(market_sentiment['score']) < 0.2 and technical_sentiment['vix_level'] > 20,
-                'neutral': abs(market_sentiment['score']) <= 0.2 and technical_sentiment['vix_level'] <= 20,
+                'volatility_expected': vix_level / 20,
+                'bullish': overall == 'bullish',
+                'bearish': overall == 'bearish',
+                'volatile': abs_score < SENTIMENT_THRESHOLD and vix_level > 20,
+                'neutral': abs_score <= SENTIMENT_THRESHOLD and vix_level <= 20,
                 'sector_sentiment': sector_sentiment,
-                'news_factors': await self._get_news_factors(),
+                'news_factors': news_factors,
                 'technical_sentiment': technical_sentiment,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now.isoformat(),
                 'data_sources': ['ibkr_news', 'market_data', 'technical']
             }
+            if not degraded:
+                self._sentiment_cache = (
+                    combined_sentiment,
+                    time.monotonic() + self.update_interval
+                )
             return combined_sentiment
         except Exception as e:
             self.logger.error(f"Error getting market sentiment: {e}")
             return self._get_default_sentiment()
 
-    async def _update_market_data(self):
-        """Update market data for all indexes in parallel with better error handling"""
-        if (self.last_update and datetime.now() - self.last_update < self.update_interval):
+    async def _update_market_data(self, now: datetime):
+        """Update market data for all indexes and sector ETFs in parallel with better error handling"""
+        if self.last_update is not None and time.monotonic() - self.last_update < self.update_interval:
             return
             
         try:
-            # Create parallel tasks for all market indexes
-            tasks = []
-            for symbol in self.market_indexes:
-                if symbol == 'VIX':
-                    tasks.append(self._fetch_symbol_data(symbol, 'IND'))
-                else:
-                    tasks.append(self._fetch_symbol_data(symbol, 'STK'))
-            
             # Execute all requests in parallel
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await self._fetch_many(self._universe)
             
             # Process results
             successful_updates = 0
-            for i, result in enumerate(results):
-                symbol = self.market_indexes[i]
-                
+            for (symbol, _), result in zip(self._universe, results):
                 if isinstance(result, Exception):
                     self.logger.warning(f"Failed to get data for {symbol}: {result}")
                     # Set fallback data
-                    self.news_cache[symbol] = self._get_fallback_data(symbol)
+                    self.news_cache[symbol] = self._get_fallback_data(symbol, now)
                 elif result:
                     self.news_cache[symbol] = {
                         'market_data': result,
                         'news': [],
-                        'last_update': datetime.now()
+                        'last_update': now
                     }
                     successful_updates += 1
                 else:
-                    self.news_cache[symbol] = self._get_fallback_data(symbol)
+                    self.news_cache[symbol] = self._get_fallback_data(symbol, now)
             
-            self.last_update = datetime.now()
-            self.logger.info(f"Market data update completed: {successful_updates}/{len(self.market_indexes)} successful")
+            self.last_update = time.monotonic()
+            self.logger.info(f"Market data update completed: {successful_updates}/{len(self._universe)} successful")
             
         except Exception as e:
             self.logger.error(f"Error in market data update: {e}")
 
+    async def _acquire_request_token(self):
+        """Token bucket pacing for IBKR requests: bursts up to the bucket size, then the sustained rate"""
+        now = time.monotonic()
+        rate = self.max_requests_per_second
+        self._request_tokens = min(rate, self._request_tokens + (now - self._tokens_updated) * rate)
+        self._tokens_updated = now
+        
+        # Take the token now and wait out any deficit, so later callers queue behind us
+        self._request_tokens -= 1.0
+        if self._request_tokens < 0:
+            await asyncio.sleep(-self._request_tokens / rate)
+
+    async def _fetch_many(self, requests: List[tuple]) -> list:
+        """Fetch (symbol, sec_type) pairs concurrently, at most max_concurrent_requests at a time.
+
+        Results are in request order; failures come back as exceptions.
+        """
+        # Created per call: the handler is driven from more than one event loop
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def bounded_fetch(symbol: str, sec_type: str):
+            async with semaphore:
+                await self._acquire_request_token()
+                return await self._fetch_symbol_data(symbol, sec_type)
+
+        return await asyncio.gather(
+            *(bounded_fetch(symbol, sec_type) for symbol, sec_type in requests),
+            return_exceptions=True
+        )
+
     async def _fetch_symbol_data(self, symbol: str, sec_type: str) -> dict:
         """Fetch data for a single symbol with timeout protection"""
         try:
@@ -170,7 +300,7 @@ class NewsHandler2026:
                 
         return True
 
-    def _get_fallback_data(self, symbol: str) -> dict:
+    def _get_fallback_data(self, symbol: str, now: datetime) -> dict:
         """Get fallback data for a symbol when real data is unavailable"""
         return {
             'market_data': {
@@ -182,7 +312,7 @@ class NewsHandler2026:
                 'error': 'fallback_data'
             },
             'news': [],
-            'last_update': datetime.now()
+            'last_update': now
         }
 
     async def _analyze_market_sentiment(self) -> Dict:
@@ -194,26 +324,17 @@ class NewsHandler2026:
             market_data = spy_data['market_data']
             
             # Calculate price-based sentiment
-            if (market_data.get('last') and 
-                market_data.get('close') and 
-                market_data['last'] > 0 and 
-                market_data['close'] > 0):
-                
-                price_change = (market_data['last'] - market_data['close']) / market_data['close']
+            last, close = market_data.get('last'), market_data.get('close')
+            if last and close and last > 0 and close > 0:
+                price_change = (last - close) / close
             else:
                 price_change = 0
             
             # Simple sentiment scoring based on price movement
             sentiment_score = price_change * 2.0  # Amplify the signal
             
-            if sentiment_score > 0.2:
-                sentiment = 'bullish'
-            elif sentiment_score < -0.2:
-                sentiment = 'bearish'
-            else:
-                sentiment = 'neutral'
-                
-            confidence = 0.8 if market_data.get('last', 0) > 0 else 0.3
+            sentiment = _classify_sentiment(sentiment_score)
+            confidence = 0.8 if last and last > 0 else 0.3
             
             return {
                 'sentiment': sentiment,
@@ -227,32 +348,15 @@ class NewsHandler2026:
 
     async def _analyze_sector_sentiment(self) -> Dict:
         """Analyze sector sentiment using sector ETFs instead of individual stocks"""
-        # Use sector ETFs for faster, more reliable sector analysis
-        sector_etfs = {
-            'technology': 'XLK',    # Technology Select Sector SPDR
-            'healthcare': 'XLV',    # Health Care Select Sector SPDR  
-            'energy': 'XLE',        # Energy Select Sector SPDR
-            'financials': 'XLF',    # Financial Select Sector SPDR
-            'consumer_discretionary': 'XLY',  # Consumer Discretionary SPDR
-            'industrials': 'XLI'    # Industrial Select Sector SPDR
-        }
-        
-        # Process all sector ETFs in parallel
-        sector_tasks = []
-        for sector_name, etf_symbol in sector_etfs.items():
-            sector_tasks.append(self._fetch_symbol_data(etf_symbol, 'STK'))
-        
-        sector_results = await asyncio.gather(*sector_tasks, return_exceptions=True)
-        
-        # Process results into sector sentiment
+        # Sector ETF data is fetched with the indexes by _update_market_data
         sector_sentiment = {}
-        for i, (sector_name, etf_symbol) in enumerate(sector_etfs.items()):
-            result = sector_results[i]
+        for sector_name, etf_symbol in SECTOR_ETFS.items():
+            result = self.news_cache.get(etf_symbol, {}).get('market_data')
             
-            if isinstance(result, Exception):
-                self.logger.debug(f"Failed to get data for {sector_name} ETF ({etf_symbol}): {result}")
+            if not result or result.get('error'):
+                # Fallback prices would read as a fake move; treat as flat
                 sector_sentiment[sector_name] = 0.0
-            elif result and result.get('last') and result.get('close'):
+            elif result.get('last') and result.get('close'):
                 # Calculate price-based sentiment from ETF performance
                 price_change = (result['last'] - result['close']) / result['close']
                 sector_sentiment[sector_name] = price_change
@@ -274,8 +378,9 @@ class NewsHandler2026:
                     vix_level = vix_data['last']
                     self.logger.debug(f"Using cached VIX data: {vix_level}")
             else:
-                # Fallback to direct API call
+                # Fallback to direct API call, paced like the batch requests
                 try:
+                    await self._acquire_request_token()
                     vix_data = await self.ibkr_client.get_market_data('VIX', sec_type='IND')
                     if vix_data and vix_data.get('last') and vix_data['last'] > 0 and not vix_data.get('error'):
                         vix_level = vix_data['last']
@@ -287,9 +392,9 @@ class NewsHandler2026:
             spy_data = self.news_cache.get('SPY', {})
             if spy_data and spy_data.get('market_data'):
                 market_data = spy_data['market_data']
-                if (market_data.get('last') and market_data.get('close') and 
-                    market_data['last'] > 0 and market_data['close'] > 0):
-                    momentum = (market_data['last'] - market_data['close']) / market_data['close']
+                last, close = market_data.get('last'), market_data.get('close')
+                if last and close and last > 0 and close > 0:
+                    momentum = (last - close) / close
                 else:
                     momentum = 0.0
             else:
@@ -320,28 +425,26 @@ class NewsHandler2026:
 
     async def _calculate_bull_bear_ratio(self) -> float:
         try:
-            spy = Contract(symbol='SPY', secType='STK', exchange='SMART', currency='USD')
-            options = await self.ibkr_client.reqContractDetails(
-                Contract(symbol='SPY', secType='OPT', exchange='SMART', currency='USD')
-            )
+            options = await self.ibkr_client.reqContractDetails(self._spy_options_contract)
             if not options:
                 return 0.5
-            puts = sum(1 for opt in options if opt.contract.right == 'P')
-            calls = sum(1 for opt in options if opt.contract.right == 'C')
+            # One pass over what can be thousands of contracts
+            rights = Counter(opt.contract.right for opt in options)
+            calls = rights['C']
             if calls == 0:
                 return 0.5
-            return puts / calls
+            return rights['P'] / calls
         except Exception as e:
             self.logger.error(f"Error calculating bull/bear ratio: {e}")
             return 0.5
 
-    async def _get_news_factors(self) -> Dict:
+    async def _get_news_factors(self, now: datetime) -> Dict:
         """Get market news factors that affect overall sentiment"""
         try:
-            earnings_season = await self._check_earnings_season()
-            fed_announcement = await self._check_fed_announcement()
+            earnings_season = await self._check_earnings_season(now)
+            fed_announcement = await self._check_fed_announcement(now)
             geopolitical_risk = await self._get_geopolitical_risk()
-            market_events = await self._get_market_events()
+            market_events = await self._get_market_events(now, earnings_season, fed_announcement)
             
             # Add volatility-based risk assessment
             vix_cache = self.news_cache.get('VIX', {})
@@ -375,27 +478,19 @@ class NewsHandler2026:
     def _analyze_news_sentiment(self, news_articles: List[NewsArticle]) -> float:
         if not news_articles:
             return 0.0
-        positive_count = sum(1 for article in news_articles if getattr(article, 'positive', False))
-        negative_count = sum(1 for article in news_articles if getattr(article, 'negative', False))
-        total_count = len(news_articles)
-        if total_count == 0:
-            return 0.0
-        sentiment_score = (positive_count - negative_count) / total_count
-        return sentiment_score
+        # Single pass over the articles, accumulating positive minus negative
+        net_count = 0
+        for article in news_articles:
+            net_count += bool(getattr(article, 'positive', False)) - bool(getattr(article, 'negative', False))
+        return net_count / len(news_articles)
 
-    async def _check_earnings_season(self) -> bool:
-        current_month = datetime.now().month
-        return current_month in [1, 4, 7, 10]
+    async def _check_earnings_season(self, current_date: datetime) -> bool:
+        return current_date.month in _EARNINGS_MONTHS
 
-    async def _check_fed_announcement(self) -> bool:
+    async def _check_fed_announcement(self, current_date: datetime) -> bool:
         """Check if we're near a Fed announcement date"""
-        # FOMC typically meets 8 times per year, roughly every 6 weeks
-        # Meeting dates are usually: Jan, Mar, May, Jun, Jul, Sep, Nov, Dec
-        current_date = datetime.now()
-        fed_months = [1, 3, 5, 6, 7, 9, 11, 12]
-        
         # Check if current month has Fed meeting and we're in the week before/after
-        if current_date.month in fed_months:
+        if current_date.month in _FOMC_MONTHS:
             # Rough estimate - more sophisticated logic would use actual FOMC calendar
             day_of_month = current_date.day
             # Fed meetings typically in the middle of the month
@@ -407,57 +502,26 @@ class NewsHandler2026:
     async def _get_geopolitical_risk(self) -> float:
         return 0.0
 
-    async def _get_market_events(self) -> List[str]:
+    async def _get_market_events(self, current_date: datetime, earnings_season: bool,
+                                 fed_announcement: bool) -> List[str]:
         """Get significant market events that could affect trading"""
         events = []
-        current_date = datetime.now()
         
         # Check for major economic releases (simplified)
         if current_date.weekday() == 4:  # Friday
             events.append("Jobs Report Week")
         
         # Check for earnings season
-        if await self._check_earnings_season():
+        if earnings_season:
             events.append("Earnings Season")
             
         # Check for Fed meetings
-        if await self._check_fed_announcement():
+        if fed_announcement:
             events.append("FOMC Meeting")
             
         # Add more sophisticated event detection as needed
         return events
 
     def _get_default_sentiment(self) -> Dict:
-        return {
-            'overall_sentiment': 'neutral',
-            'sentiment_score': 0.0,
-            'confidence': 0.5,
-            'volatility_expected': 0.5,
-            'bullish': False,
-            'bearish': False,
-            'volatile': False,
-            'neutral': True,
-            'sector_sentiment': {
-                'technology': 0.0,
-                'healthcare': 0.0,
-                'energy': 0.0,
-                'financials': 0.0,
-                'consumer_discretionary': 0.0,
-                'industrials': 0.0
-            },
-            'news_factors': {
-                'earnings_season': False,
-                'fed_announcement': False,
-                'geopolitical_risk': 0.0,
-                'market_events': [],
-                'vix_risk_level': 'medium',
-                'market_stress': False
-            },
-            'technical_sentiment': {
-                'vix_level': 20.0,
-                'bull_bear_ratio': 0.5,
-                'market_momentum': 0.0
-            },
-            'timestamp': datetime.now().isoformat(),
-            'data_sources': ['default']
-        }
+        # Nested values are shared with the template; consumers only read them
+        return {**_DEFAULT_SENTIMENT, 'timestamp': datetime.now().isoformat()}
@@ -1,9 +1,11 @@
 # risk_mgmt_2026/portfolio_monitor.py
+import asyncio
+import inspect
 import time
 import threading
 from datetime import datetime
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 class PortfolioMonitor2026:
     """Continuous monitoring with position management"""
@@ -13,22 +15,38 @@ class PortfolioMonitor2026:
         self.ibkr_client = ibkr_client
         self.current_positions = {}
         self.position_entry_prices = {}  # Track entry prices
+        # conId -> (position_id, trade_type, is_long); both are fixed while a position is held
+        self._position_meta: Dict[int, Tuple[str, str, bool]] = {}
         self.monitoring = False
         self.monitor_thread = None
+        self.monitor_task = None
+        self._stop_event = threading.Event()  # Wakes the monitor thread on stop
+        # Async clients (IBKRClient2026) are polled from an asyncio task on their own
+        # event loop; sync clients (IBKRSyncWrapper) from a background thread
+        self._async_client = inspect.iscoroutinefunction(getattr(ibkr_client, 'get_positions', None))
         self.update_interval = 10
         self.portfolio_update_interval = 60
         self.last_portfolio_update = 0
         self.logger = logging.getLogger(__name__)
 
     def start_monitoring(self):
+        """Start monitoring; with an async client this must be called from its event loop"""
         if not self.monitoring:
             self.monitoring = True
-            self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
-            self.monitor_thread.start()
+            self._stop_event.clear()
+            if self._async_client:
+                self.monitor_task = asyncio.get_running_loop().create_task(self._monitor_loop_async())
+            else:
+                self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
+                self.monitor_thread.start()
             self.logger.info("Portfolio monitoring started")
 
     def stop_monitoring(self):
         self.monitoring = False
+        self._stop_event.set()
+        if self.monitor_task:
+            self.monitor_task.cancel()
+            self.monitor_task = None
         if self.monitor_thread:
             self.monitor_thread.join()
         self.logger.info("Portfolio monitoring stopped")
@@ -40,81 +58,129 @@ class PortfolioMonitor2026:
                 if current_time - self.last_portfolio_update > self.portfolio_update_interval:
                     self._update_portfolio_value()
                     self.last_portfolio_update = current_time
-                if self.risk_manager.is_trading_halted():
-                    time.sleep(self.update_interval)
-                    continue
-                self._check_positions()
-                time.sleep(self.update_interval)
+                if not self.risk_manager.is_trading_halted():
+                    self._check_positions()
             except Exception as e:
                 self.logger.error(f"Monitor loop error: {e}")
-                time.sleep(self.update_interval)
+            self._stop_event.wait(self.update_interval)
+
+    async def _monitor_loop_async(self):
+        """Same cycle as _monitor_loop, awaiting the async client instead of blocking"""
+        while self.monitoring:
+            try:
+                current_time = time.time()
+                if current_time - self.last_portfolio_update > self.portfolio_update_interval:
+                    await self._update_portfolio_value_async()
+                    self.last_portfolio_update = current_time
+                if not self.risk_manager.is_trading_halted():
+                    await self._check_positions_async()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Monitor loop error: {e}")
+            await asyncio.sleep(self.update_interval)
 
     def _update_portfolio_value(self):
         try:
             # Get real account value
-            account_value = self.ibkr_client.get_account_value()
-            if account_value > 0:
-                self.risk_manager.update_portfolio_value(account_value)
-                self.logger.info(f"Portfolio value updated: ${account_value:,.2f}")
+            self._apply_account_value(self.ibkr_client.get_account_value())
         except Exception as e:
             self.logger.error(f"Failed to update portfolio value: {e}")
 
+    async def _update_portfolio_value_async(self):
+        try:
+            self._apply_account_value(await self.ibkr_client.get_account_value())
+        except Exception as e:
+            self.logger.error(f"Failed to update portfolio value: {e}")
+
+    def _apply_account_value(self, account_value):
+        if account_value and account_value > 0:
+            self.risk_manager.update_portfolio_value(account_value)
+            self.logger.info(f"Portfolio value updated: ${account_value:,.2f}")
+
     def _check_positions(self):
         """Check all positions for exit conditions"""
         try:
             # Get current positions from IBKR
-            positions = self.ibkr_client.get_positions()
-            
-            for position in positions:
-                try:
-                    symbol = position.contract.symbol
-                    position_size = position.position
-                    
-                    # Skip if not an option position
-                    if position.contract.secType not in ['OPT', 'BAG']:
-                        continue
-                    
-                    # Get or store entry price
-                    position_id = f"{symbol}_{position.contract.conId}"
-                    if position_id not in self.position_entry_prices:
-                        # Use average cost as entry price
-                        self.position_entry_prices[position_id] = position.avgCost
-                        self.logger.info(f"Tracking new position: {symbol} at ${position.avgCost:.2f}")
-                    
-                    entry_price = self.position_entry_prices[position_id]
-                    
-                    # Get current market value per unit
-                    current_value = position.marketValue / abs(position.position) if position.position != 0 else 0
-                    
-                    # Determine trade type from position
-                    trade_type = self._determine_trade_type(position)
-                    
-                    # Check exit conditions
-                    should_exit, exit_reason = self.risk_manager.check_exit_conditions(
-                        position_id, 
-                        entry_price, 
-                        current_value, 
-                        trade_type
-                    )
-                    
-                    if should_exit:
-                        self.logger.info(f"🚨 Exit signal for {symbol}: {exit_reason}")
-                        self._close_position(position, exit_reason)
-                        
-                        # Clean up tracking
-                        self.risk_manager.cleanup_trade(position_id)
-                        del self.position_entry_prices[position_id]
-                    else:
-                        # Log position status
-                        pnl_pct = ((current_value - entry_price) / entry_price) * 100 if entry_price != 0 else 0
-                        self.logger.debug(f"Position {symbol}: PnL {pnl_pct:.1f}%, Status: {exit_reason}")
-                        
-                except Exception as e:
-                    self.logger.error(f"Error checking position {position.contract.symbol}: {e}")
-                    
+            self._process_positions(self.ibkr_client.get_positions())
+        except Exception as e:
+            self.logger.error(f"Error in position check: {e}")
+
+    async def _check_positions_async(self):
+        """Check all positions for exit conditions"""
+        try:
+            self._process_positions(await self.ibkr_client.get_positions())
         except Exception as e:
             self.logger.error(f"Error in position check: {e}")
 
+    def _process_positions(self, positions):
+        """Evaluate every option position, then act on exit signals in position order"""
+        exits = []
+        for position in positions:
+            try:
+                exit_signal = self._check_one_position(position)
+                if exit_signal:
+                    exits.append(exit_signal)
+            except Exception as e:
+                self.logger.error(f"Error checking position {position.contract.symbol}: {e}")
+        
+        # Closing orders go out only after all checks, in a deterministic order
+        for position, position_id, exit_reason in exits:
+            try:
+                self.logger.info(f"🚨 Exit signal for {position.contract.symbol}: {exit_reason}")
+                self._close_position(position, exit_reason)
+                
+                # Clean up tracking
+                self.risk_manager.cleanup_trade(position_id)
+                del self.position_entry_prices[position_id]
+                self._position_meta.pop(position.contract.conId, None)
+            except Exception as e:
+                self.logger.error(f"Error closing position {position.contract.symbol}: {e}")
+
+    def _check_one_position(self, position) -> Optional[Tuple[object, str, str]]:
+        """Check one position; returns (position, position_id, exit_reason) if it should be closed"""
+        symbol = position.contract.symbol
+        
+        # Skip if not an option position
+        if position.contract.secType not in ['OPT', 'BAG']:
+            return None
+        
+        # Derived fields only change if the position flips direction
+        con_id = position.contract.conId
+        is_long = position.position > 0
+        meta = self._position_meta.get(con_id)
+        if meta is None or meta[2] != is_long:
+            meta = (f"{symbol}_{con_id}", self._determine_trade_type(position), is_long)
+            self._position_meta[con_id] = meta
+        position_id, trade_type, _ = meta
+        
+        # Get or store entry price
+        if position_id not in self.position_entry_prices:
+            # Use average cost as entry price
+            self.position_entry_prices[position_id] = position.avgCost
+            self.logger.info(f"Tracking new position: {symbol} at ${position.avgCost:.2f}")
+        
+        entry_price = self.position_entry_prices[position_id]
+        
+        # Get current market value per unit
+        current_value = position.marketValue / abs(position.position) if position.position != 0 else 0
+        
+        # Check exit conditions
+        should_exit, exit_reason = self.risk_manager.check_exit_conditions(
+            position_id, 
+            entry_price, 
+            current_value, 
+            trade_type
+        )
+        
+        if should_exit:
+            return position, position_id, exit_reason
+        
+        # Log position status
+        pnl_pct = ((current_value - entry_price) / entry_price) * 100 if entry_price != 0 else 0
+        self.logger.debug(f"Position {symbol}: PnL {pnl_pct:.1f}%, Status: {exit_reason}")
+        return None
+
     def _determine_trade_type(self, position) -> str:
         """Determine if position is bull, bear, or volatile based on contract type"""
         if position.contract.secType == 'BAG':
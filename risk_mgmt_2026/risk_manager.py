@@ -60,6 +60,7 @@ class RiskManager2026:
         self.current_date = date.today()
         self.trailing_stops = {}
         self.highest_profits = {}
+        self._stops_count = 0  # len(trailing_stops), maintained under _lock
         self._lock = threading.Lock()
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
@@ -113,6 +114,7 @@ class RiskManager2026:
             if trade_id not in self.trailing_stops:
                 self.trailing_stops[trade_id] = current_price * (1 - self.trailing_stop_pct)
                 self.highest_profits[trade_id] = profit_pct
+                self._stops_count += 1
                 return False, 'trailing_active'
             if profit_pct > self.highest_profits[trade_id]:
                 self.highest_profits[trade_id] = profit_pct
@@ -151,9 +153,15 @@ class RiskManager2026:
 
     def cleanup_trade(self, trade_id: str):
         with self._lock:
-            self.trailing_stops.pop(trade_id, None)
+            if self.trailing_stops.pop(trade_id, None) is not None:
+                self._stops_count -= 1
             self.highest_profits.pop(trade_id, None)
 
+    @property
+    def active_trailing_stops(self) -> int:
+        """Number of trades with an active trailing stop"""
+        return self._stops_count
+
     def get_risk_summary(self) -> Dict[str, Any]:
         """Get comprehensive risk summary for monitoring"""
         return {
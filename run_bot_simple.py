@@ -64,13 +64,17 @@ def main():
     
     # Import and run the main bot
     try:
-        from main_sync_with_web import OptionsTradingBot2026
+        from main_sync_with_web import TradingBotMain
         
-        bot = OptionsTradingBot2026()
-        
-        # Try to initialize with retries
+        # Try to initialize with retries; each attempt gets a fresh bot so a
+        # failed attempt's IBKR session and components are released, not kept
         max_init_retries = 3
+        max_backoff = 300  # seconds
         for attempt in range(max_init_retries):
+            bot = TradingBotMain()
+            # Route SIGTERM/SIGINT to the current bot so shutdown() runs
+            signal.signal(signal.SIGTERM, bot.signal_handler)
+            signal.signal(signal.SIGINT, bot.signal_handler)
             try:
                 logger.info(f"Initialization attempt {attempt + 1}/{max_init_retries}...")
                 if bot.initialize():
@@ -80,8 +84,13 @@ def main():
                     raise Exception("Initialization returned False")
             except Exception as e:
                 logger.error(f"Initialization attempt {attempt + 1} failed: {e}")
+                if bot.ibkr_client:
+                    try:
+                        bot.ibkr_client.disconnect()
+                    except Exception as disconnect_error:
+                        logger.warning(f"Error releasing IBKR session: {disconnect_error}")
                 if attempt < max_init_retries - 1:
-                    wait_time = 10 * (attempt + 1)
+                    wait_time = min(10 * 2 ** attempt, max_backoff)
                     logger.info(f"Waiting {wait_time} seconds before retry...")
                     time.sleep(wait_time)
                 else:
@@ -6,7 +6,6 @@ Provides additional checks and monitoring before starting real trading
 
 import asyncio
 import logging
-import sys
 from datetime import datetime
 from ibkr_client_2026.client import IBKRClient2026
 from config_2026.config_loader import ConfigLoader2026
@@ -103,21 +102,14 @@ async def check_prerequisites():
 async def start_bot_with_monitoring():
     """Start the bot with enhanced monitoring"""
     # Import main bot
-    from main import OptionsTradingBot2026
+    from main import OptionsTradingBot2026, setup_logging
     
     print("\n" + "="*60)
     print("Starting Options Trading Bot 2026...")
     print("="*60)
     
-    # Set up enhanced logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('options_bot_2026.log'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Set up logging; file/console writes happen on a listener thread
+    log_listener = setup_logging()
     
     bot = OptionsTradingBot2026()
     
@@ -142,6 +134,7 @@ async def start_bot_with_monitoring():
         logging.error(f"Fatal error: {e}", exc_info=True)
     finally:
         await bot.shutdown()
+        log_listener.stop()
         print("\n✓ Bot shutdown complete.")
 
 async def main():
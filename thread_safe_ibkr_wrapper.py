@@ -4,6 +4,7 @@ Provides thread-safe access to IBKR functionality with all required methods.
 """
 
 import logging
+import inspect
 import threading
 from datetime import datetime, time
 from typing import Dict, List, Optional, Any
@@ -25,6 +26,13 @@ class ThreadSafeIBKRWrapper:
         self.sync_client = sync_client
         self._lock = threading.Lock()
         
+        # Resolve get_market_data's signature once, not under the lock per call
+        market_data = getattr(sync_client, 'get_market_data', None)
+        self._has_market_data = market_data is not None
+        self._market_data_takes_sec_type = (
+            self._has_market_data and 'sec_type' in inspect.signature(market_data).parameters
+        )
+        
     def get_account_value(self) -> float:
         """Get current account value"""
         with self._lock:
@@ -36,22 +44,17 @@ class ThreadSafeIBKRWrapper:
     
     def get_market_data(self, symbol: str, sec_type: str = 'STK') -> Dict[str, Any]:
         """Get market data for symbol with security type support"""
+        if not self._has_market_data:
+            return {}
+            
         with self._lock:
             try:
-                # Check if sync client supports sec_type parameter
-                if hasattr(self.sync_client, 'get_market_data'):
-                    method = getattr(self.sync_client, 'get_market_data')
-                    import inspect
-                    sig = inspect.signature(method)
-                    
-                    # If sync client supports sec_type, pass it through
-                    if 'sec_type' in sig.parameters:
-                        return self.sync_client.get_market_data(symbol, sec_type=sec_type) or {}
-                    else:
-                        # Legacy support - just pass symbol
-                        return self.sync_client.get_market_data(symbol) or {}
+                # If sync client supports sec_type, pass it through
+                if self._market_data_takes_sec_type:
+                    return self.sync_client.get_market_data(symbol, sec_type=sec_type) or {}
                 else:
-                    return {}
+                    # Legacy support - just pass symbol
+                    return self.sync_client.get_market_data(symbol) or {}
             except Exception as e:
                 logger.error(f"Error getting market data for {symbol}: {e}")
                 return {}
@@ -92,6 +95,27 @@ class ThreadSafeIBKRWrapper:
                 logger.error(f"Error getting positions: {e}")
                 return []
     
+    def get_positions_dict(self) -> Dict[int, Any]:
+        """Get current positions keyed by contract conId"""
+        with self._lock:
+            try:
+                return self.sync_client.get_positions_dict() or {}
+            except Exception as e:
+                logger.error(f"Error getting positions: {e}")
+                return {}
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get account value and positions together under one lock acquisition"""
+        with self._lock:
+            try:
+                return {
+                    'account_value': self.sync_client.get_account_value(),
+                    'positions': self.sync_client.get_positions() or []
+                }
+            except Exception as e:
+                logger.error(f"Error getting account snapshot: {e}")
+                return {'account_value': 0.0, 'positions': []}
+    
     def reqContractDetails(self, contract) -> List:
         """Get contract details"""
         with self._lock:
@@ -1,15 +1,17 @@
 from datetime import datetime
 
-def collect_portfolio_data(bot):
+def collect_portfolio_data(bot, risk_summary=None):
     """
     Collects portfolio value and P&L from the bot.
     Args:
         bot: The main OptionsTradingBot2026 instance.
+        risk_summary: Already-collected risk summary to reuse (optional).
     Returns:
         dict: Portfolio data.
     """
     value = bot.risk_manager.get_portfolio_value() if bot.risk_manager else 0
-    risk_summary = bot.risk_manager.get_risk_summary() if bot.risk_manager else {}
+    if risk_summary is None:
+        risk_summary = collect_risk_metrics(bot)
     return {
         'portfolio_value': value,
         'max_trade_size': risk_summary.get('max_trade_size', 0),
@@ -79,12 +81,14 @@ def collect_all_data(bot):
     Returns:
         dict: Aggregated dashboard data.
     """
+    # One risk summary serves both the portfolio and risk sections
+    risk_summary = collect_risk_metrics(bot)
     return {
-        'portfolio': collect_portfolio_data(bot),
+        'portfolio': collect_portfolio_data(bot, risk_summary),
         'active_trades': collect_active_trades(bot),
         'recent_actions': collect_recent_actions(bot),
         'errors': collect_errors(bot),
-        'risk_metrics': collect_risk_metrics(bot),
+        'risk_metrics': risk_summary,
         'bot_status': getattr(bot, 'running', False),
         'last_update': datetime.now().isoformat()
     }
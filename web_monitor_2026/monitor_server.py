@@ -1,19 +1,72 @@
 # web_monitor_2026/monitor_server.py
-from flask import Flask, render_template, jsonify
+from flask import Flask, Response, render_template, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit
 import threading
+import json
+import time
 from datetime import datetime
 import logging
 import asyncio
 from typing import Dict, Any
 
+# Optional: faster JSON encoding for dashboard payloads (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson else 0
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider using orjson, deferring to Flask for types it rejects"""
+
+    def dumps(self, obj, **kwargs):
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Build the body straight from orjson's bytes (no str round-trip)
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+class _OrjsonSocketIOJson:
+    """json-module stand-in for Socket.IO packet encoding"""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            return json.dumps(obj, **kwargs)
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
 class BotMonitorServer:
     """Real-time web monitor for Options Trading Bot 2026"""
 
     def __init__(self, bot_instance=None, port=5000):
         self.app = Flask(__name__)
         self.app.config['SECRET_KEY'] = 'options_bot_2026_monitor'
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        if orjson:
+            self.app.json = _OrjsonProvider(self.app)
+            self.socketio = SocketIO(self.app, cors_allowed_origins="*", json=_OrjsonSocketIOJson)
+        else:
+            self.socketio = SocketIO(self.app, cors_allowed_origins="*")
         self.bot_instance = bot_instance
         self.port = port
         self.running = False
@@ -44,6 +97,11 @@ class BotMonitorServer:
             'activity_log': [],
             'last_update': datetime.now().isoformat()
         }
+        self._data_lock = threading.Lock()
+        self._last_broadcast = 0.0  # time.monotonic() of the last status_update
+        self._data_version = 0  # Bumped under _data_lock whenever current_data changes
+        self._status_body = (-1, b'')  # (data version, encoded /api/status body)
+        self.heartbeat_interval = 30.0  # seconds; max gap between unchanged broadcasts
         self.logger = logging.getLogger(__name__)
         self._setup_routes()
         self._setup_socketio_events()
@@ -55,7 +113,13 @@ class BotMonitorServer:
         
         @self.app.route('/api/status')
         def get_status():
-            return jsonify(self.current_data)
+            # Encode once per data change, not once per browser poll
+            version, body = self._status_body
+            if version != self._data_version:
+                version = self._data_version
+                body = self.app.json.dumps(self.current_data)
+                self._status_body = (version, body)
+            return Response(body, mimetype='application/json')
         
         @self.app.route('/api/trades')
         def get_trades():
@@ -114,40 +178,98 @@ class BotMonitorServer:
         """Background task to update monitor data"""
         while self.running:
             try:
-                if self.bot_instance:
-                    # Update portfolio value
-                    portfolio_value = await self.bot_instance.get_portfolio_value()
-                    self.update_portfolio_value(portfolio_value)
-                    
-                    # Update active trades
-                    active_trades = await self.bot_instance.get_active_trades()
-                    self.update_active_trades(active_trades)
-                    
-                    # Update risk metrics
-                    risk_metrics = await self.bot_instance.get_risk_metrics()
-                    self.update_risk_metrics(risk_metrics)
-                    
-                    # Update health status
-                    health_status = await self.bot_instance.get_health_status()
-                    self.update_health_status(health_status)
+                if hasattr(self.bot_instance, 'get_dashboard_snapshot'):
+                    # One call gathers every field from a single IBKR fetch
+                    self.update_snapshot(await self.bot_instance.get_dashboard_snapshot())
+                elif self.bot_instance:
+                    # Collect all values, then publish them as one update
+                    self.update_snapshot({
+                        'portfolio_value': await self.bot_instance.get_portfolio_value(),
+                        'active_trades': await self.bot_instance.get_active_trades(),
+                        'risk_metrics': await self.bot_instance.get_risk_metrics(),
+                        'health_status': await self.bot_instance.get_health_status()
+                    })
                 
                 await asyncio.sleep(5)  # Update every 5 seconds
             except Exception as e:
                 self.logger.error(f"Error in update loop: {e}")
                 await asyncio.sleep(5)
 
-    def update_portfolio_value(self, value: float):
-        """Update portfolio value and calculate PnL"""
+    def update_snapshot(self, snapshot: dict):
+        """Apply several updates at once and broadcast a single status update.
+
+        Recognised keys: portfolio_value, active_trades, risk_metrics,
+        health_status and market_sentiment. Missing keys are left unchanged.
+        Nothing is broadcast when the values are unchanged, apart from a
+        heartbeat every heartbeat_interval seconds.
+        """
+        with self._data_lock:
+            before = self._snapshot_fields()
+            if 'portfolio_value' in snapshot:
+                self._apply_portfolio_value(snapshot['portfolio_value'])
+            if 'active_trades' in snapshot:
+                self.current_data['active_trades'] = snapshot['active_trades']
+            if 'risk_metrics' in snapshot:
+                self.current_data['risk_metrics'] = snapshot['risk_metrics']
+            if 'health_status' in snapshot:
+                self._apply_health_status(snapshot['health_status'])
+            if 'market_sentiment' in snapshot:
+                self._apply_market_sentiment(snapshot['market_sentiment'])
+            
+            changed = self._snapshot_fields() != before
+            if not changed and time.monotonic() - self._last_broadcast < self.heartbeat_interval:
+                return
+            self.current_data['last_update'] = datetime.now().isoformat()
+        self._broadcast_update()
+
+    def _snapshot_fields(self) -> tuple:
+        """Values update_snapshot can change, copied for change detection"""
+        data = self.current_data
+        return (
+            data['portfolio_value'],
+            data['daily_pnl'],
+            data['active_trades'],
+            data['risk_metrics'],
+            dict(data['health_metrics']),  # Updated in place, so copy it
+            data['market_sentiment'],
+        )
+
+    def _apply_portfolio_value(self, value: float):
+        """Store portfolio value and derive PnL from the previous value"""
         old_value = self.current_data['portfolio_value']
         self.current_data['portfolio_value'] = value
         self.current_data['daily_pnl'] = value - old_value if old_value > 0 else 0
-        self.current_data['last_update'] = datetime.now().isoformat()
-        self._broadcast_update()
+
+    def _apply_health_status(self, health_data: dict) -> bool:
+        """Store known health metrics; returns False for malformed data"""
+        if not isinstance(health_data, dict):
+            self.logger.error(f"Invalid health data format: {health_data}")
+            return False
+            
+        # Update only valid health metrics
+        for component, status in health_data.items():
+            if component in self.current_data['health_metrics']:
+                self.current_data['health_metrics'][component] = bool(status)
+        return True
+
+    def _apply_market_sentiment(self, sentiment_data: dict) -> bool:
+        """Store market sentiment; returns False for malformed data"""
+        if not isinstance(sentiment_data, dict):
+            self.logger.error(f"Invalid sentiment data format: {sentiment_data}")
+            return False
+        
+        self.current_data['market_sentiment'] = sentiment_data
+        return True
+
+    def update_portfolio_value(self, value: float):
+        """Update portfolio value and calculate PnL"""
+        self.update_snapshot({'portfolio_value': value})
 
     def add_trade_action(self, action_type: str, symbol: str, strategy: str, details: dict):
         """Add a new trade action to the recent actions list"""
+        now = datetime.now().isoformat()
         action = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now,
             'type': action_type,
             'symbol': symbol,
             'strategy': strategy,
@@ -155,64 +277,46 @@ class BotMonitorServer:
         }
         self.current_data['recent_actions'].insert(0, action)
         self.current_data['recent_actions'] = self.current_data['recent_actions'][:50]
-        self.current_data['last_update'] = datetime.now().isoformat()
+        self.current_data['last_update'] = now
         self._broadcast_update()
 
     def update_active_trades(self, trades: list):
         """Update the list of active trades"""
-        self.current_data['active_trades'] = trades
-        self.current_data['last_update'] = datetime.now().isoformat()
-        self._broadcast_update()
+        self.update_snapshot({'active_trades': trades})
 
     def add_error(self, error_type: str, message: str, details: dict = None):
         """Add a new error to the error list"""
+        now = datetime.now().isoformat()
         error = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now,
             'type': error_type,
             'message': message,
             'details': details or {}
         }
         self.current_data['errors'].insert(0, error)
         self.current_data['errors'] = self.current_data['errors'][:20]
-        self.current_data['last_update'] = datetime.now().isoformat()
+        self.current_data['last_update'] = now
         self._broadcast_update()
 
     def update_risk_metrics(self, metrics: dict):
         """Update risk metrics"""
-        self.current_data['risk_metrics'] = metrics
-        self.current_data['last_update'] = datetime.now().isoformat()
-        self._broadcast_update()
+        self.update_snapshot({'risk_metrics': metrics})
 
     def update_bot_status(self, status: str):
         """Update bot status"""
+        if status == self.current_data['bot_status']:
+            return
         self.current_data['bot_status'] = status
         self.current_data['last_update'] = datetime.now().isoformat()
         self._broadcast_update()
 
     def update_health_status(self, health_data: dict):
         """Update the health status of the bot components"""
-        if not isinstance(health_data, dict):
-            self.logger.error(f"Invalid health data format: {health_data}")
-            return
-            
-        # Update only valid health metrics
-        for component, status in health_data.items():
-            if component in self.current_data['health_metrics']:
-                self.current_data['health_metrics'][component] = bool(status)
-        
-        self.current_data['last_update'] = datetime.now().isoformat()
-        self._broadcast_update()
+        self.update_snapshot({'health_status': health_data})
 
     def update_market_sentiment(self, sentiment_data: dict):
         """Update the market sentiment data"""
-        if not isinstance(sentiment_data, dict):
-            self.logger.error(f"Invalid sentiment data format: {sentiment_data}")
-            return
-        
-        # Store sentiment data
-        self.current_data['market_sentiment'] = sentiment_data
-        self.current_data['last_update'] = datetime.now().isoformat()
-        self._broadcast_update()
+        self.update_snapshot({'market_sentiment': sentiment_data})
 
     def update_screening_results(self, screening_results: dict):
         """Update the stock screening results"""
@@ -224,8 +328,9 @@ class BotMonitorServer:
         self.current_data['screening_results']['bull'] = screening_results.get('bull', [])
         self.current_data['screening_results']['bear'] = screening_results.get('bear', [])
         self.current_data['screening_results']['volatile'] = screening_results.get('volatile', [])
-        self.current_data['screening_results']['last_update'] = datetime.now().isoformat()
-        self.current_data['last_update'] = datetime.now().isoformat()
+        now = datetime.now().isoformat()
+        self.current_data['screening_results']['last_update'] = now
+        self.current_data['last_update'] = now
         self._broadcast_update()
         
         # Log summary
@@ -247,9 +352,11 @@ class BotMonitorServer:
                 'details': details or {}
             }
             
-            # Add to activity log (keep last 200 entries)
-            self.current_data['activity_log'].insert(0, activity_entry)
-            self.current_data['activity_log'] = self.current_data['activity_log'][:200]
+            # Add to activity log (keep last 200 entries); called from several threads
+            with self._data_lock:
+                self.current_data['activity_log'].insert(0, activity_entry)
+                self.current_data['activity_log'] = self.current_data['activity_log'][:200]
+                self._data_version += 1
             
             # Emit immediately to connected clients
             self.socketio.emit('activity_log', activity_entry)
@@ -259,7 +366,10 @@ class BotMonitorServer:
 
     def _broadcast_update(self):
         """Broadcast updates to all connected clients"""
+        with self._data_lock:  # += isn't atomic; a lost bump would leave /api/status stale
+            self._data_version += 1
         try:
+            self._last_broadcast = time.monotonic()
             self.socketio.emit('status_update', self.current_data)
         except Exception as e:
             self.logger.error(f"Error broadcasting update: {e}")